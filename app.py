@@ -2,16 +2,150 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import traceback
+import hashlib
+import weakref
+from types import SimpleNamespace
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import python_calamine  # noqa: F401
+    # pandas gained engine="calamine" in 2.2
+    CALAMINE_AVAILABLE = tuple(int(p) for p in pd.__version__.split(".")[:2]) >= (2, 2)
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+TYPE_OPTIONS = [
+    "continuous", "integer", "ordinal",
+    "categorical", "binary", "text",
+    "datetime", "empty", "unknown"
+]
+
+
+def _approx_series_bytes(series: pd.Series, sample_rows: int = 1024) -> float:
+    """Estimate a column's memory footprint in bytes.
+
+    Fixed-width columns are measured exactly from their dtype; the string
+    payload of object columns is extrapolated from the first ``sample_rows``
+    values instead of a deep scan of every value.
+    """
+    nbytes = series.memory_usage(index=False, deep=False)
+    if series.dtype == "object" and len(series):
+        sample = series.iloc[:sample_rows]
+        payload = (
+            sample.memory_usage(index=False, deep=True)
+            - sample.memory_usage(index=False, deep=False)
+        )
+        nbytes += payload / len(sample) * len(series)
+    return nbytes
+
+
+def _frame_cached(name: str, df: pd.DataFrame, compute):
+    """Return ``compute(df)``, memoized in session state for this exact frame.
+
+    The entry holds a weak reference to the frame it was computed from and is
+    only reused while that same object is still the one passed in, so an id
+    recycled by a later frame (or another session) can never hit it.
+    """
+    cached = st.session_state.get(name)
+    if cached is None or cached[0]() is not df:
+        cached = (weakref.ref(df), compute(df))
+        st.session_state[name] = cached
+    return cached[1]
+
+
+def _overview_stats(df: pd.DataFrame) -> dict:
+    """Dataset overview metrics, gathered in a single pass over the columns."""
+    n_rows = len(df)
+    missing = []
+    mem_bytes = df.index.memory_usage()
+    for i in range(df.shape[1]):
+        series = df.iloc[:, i]
+        missing.append(np.count_nonzero(series.isna().to_numpy()))
+        mem_bytes += _approx_series_bytes(series)
+
+    return {
+        "missing": sum(missing),
+        "mem_mb": mem_bytes / 1024**2,
+        "column_info": pd.DataFrame({
+            "Column": df.columns,
+            "Type": df.dtypes.values,
+            "Non-null": [n_rows - m for m in missing],
+            "Missing": missing
+        }, index=df.columns),
+    }
+
+
+def _unique_counts(df: pd.DataFrame) -> pd.Series:
+    """Per-column distinct counts, only computed when requested in the column info view."""
+    return df.nunique()
+
+
+def _has_binary_columns(df: pd.DataFrame) -> bool:
+    """True if any text column holds bytes, i.e. Arrow could not decode it as UTF-8."""
+    for i in range(df.shape[1]):
+        series = df.iloc[:, i]
+        if series.dtype == object:
+            first = series.first_valid_index()
+            if first is not None and isinstance(series.loc[first], bytes):
+                return True
+    return False
+
+
+def _parse_upload(uploaded_file) -> pd.DataFrame:
+    """Parse an uploaded CSV/Excel file into a DataFrame."""
+    if uploaded_file.name.endswith(".csv"):
+        # Multi-threaded Arrow parser when available. Inputs Arrow rejects (e.g.
+        # ragged rows) fall back to the C parser, and so do files that are not
+        # UTF-8: Arrow reads those columns as raw bytes instead of failing.
+        if PYARROW_AVAILABLE:
+            try:
+                df = pd.read_csv(uploaded_file, engine="pyarrow")
+            except (pa.ArrowInvalid, pd.errors.ParserError):
+                df = None
+            if df is not None and not _has_binary_columns(df):
+                return df
+            uploaded_file.seek(0)
+        return pd.read_csv(uploaded_file)
+    if uploaded_file.name.endswith(".xlsx") and CALAMINE_AVAILABLE:
+        # Rust-based reader; much faster and lighter than openpyxl
+        return pd.read_excel(uploaded_file, sheet_name=0, engine="calamine")
+    return pd.read_excel(uploaded_file, sheet_name=0)
+
+
+@st.cache_resource
+def _bootstrap() -> SimpleNamespace:
+    """Resolve the app's module dependencies once per server process."""
+    from modules.utils import (
+        initialize_session_state, detect_column_types, import_configuration,
+        optimize_dtypes
+    )
+    from modules.design_system import apply_global_styles
+    from modules.db_connector import (
+        render_database_connector_ui, render_supabase_connector_ui
+    )
+
+    return SimpleNamespace(
+        initialize_session_state=initialize_session_state,
+        detect_column_types=detect_column_types,
+        import_configuration=import_configuration,
+        optimize_dtypes=optimize_dtypes,
+        apply_global_styles=apply_global_styles,
+        render_database_connector_ui=render_database_connector_ui,
+        render_supabase_connector_ui=render_supabase_connector_ui
+    )
 
 
 def main():
-    from modules.utils import initialize_session_state, detect_column_types
-    from modules.data_analyzer import ColumnAnalyzer
-    from modules.design_system import apply_global_styles
+    mods = _bootstrap()
 
-    # Apply global styling
-    apply_global_styles()
-    initialize_session_state()
+    # Apply global styling (CSS must be re-emitted on every rerun)
+    mods.apply_global_styles()
+    mods.initialize_session_state()
 
     st.title("Renvo AI - Intelligent Data Cleaning Assistant")
 
@@ -67,49 +201,80 @@ def main():
             key="file_upload_tab"
         )
 
+        auto_optimize = st.checkbox(
+            "Auto-optimize memory",
+            value=False,
+            help="Store low-cardinality text columns as categories and downcast integers",
+            key="auto_optimize_memory"
+        )
+
         if uploaded_file is not None:
             try:
-                if uploaded_file.name.endswith(".csv"):
-                    df = pd.read_csv(uploaded_file)
-                else:
-                    df = pd.read_excel(uploaded_file)
-
-                st.success(
-                    f"✅ Loaded dataset with {len(df)} rows and {len(df.columns)} columns"
+                # Zero-copy view of the upload for the fingerprint
+                buffer = uploaded_file.getbuffer()
+
+                # Name, size and a hash of the whole file identify an upload far
+                # more cheaply than parsing it again and comparing with df.equals();
+                # the optimize setting is part of it, so toggling it reloads the file
+                fingerprint = (
+                    uploaded_file.name,
+                    uploaded_file.size,
+                    hashlib.blake2b(buffer).digest(),
+                    auto_optimize
                 )
 
+                # The file is only parsed when it is new; later reruns reuse the
+                # frame already held in session state
                 if (
                     st.session_state.dataset is None
-                    or not df.equals(st.session_state.dataset)
+                    or st.session_state.get("_dataset_fp") != fingerprint
                 ):
-                    st.session_state.dataset = df.copy()
-                    st.session_state.original_dataset = df.copy()
-                    st.session_state.column_types = detect_column_types(df)
+                    df = _parse_upload(uploaded_file)
+                    if auto_optimize:
+                        df = mods.optimize_dtypes(df)
+
+                    st.session_state._dataset_fp = fingerprint
+                    st.session_state._upload_shape = df.shape
+                    # Copy-on-write keeps these aliases independent once either is modified
+                    st.session_state.dataset = df
+                    st.session_state.original_dataset = df
+                    st.session_state.column_types = mods.detect_column_types(df)
 
                     st.session_state.column_analysis = {}
                     st.session_state.cleaning_history = {}
                     st.session_state.undo_stack = []
                     st.session_state.redo_stack = []
 
+                    detected = True
+                else:
+                    detected = False
+
+                n_rows, n_cols = st.session_state._upload_shape
+                st.success(
+                    f"✅ Loaded dataset with {n_rows} rows and {n_cols} columns"
+                )
+                if detected:
                     st.info("🔍 Column types auto-detected. Review below.")
 
             except Exception as e:
                 st.error(f"❌ Error loading file: {e}")
                 st.stop()
+        else:
+            # Removing the file forgets it, so uploading it again reloads a pristine copy
+            st.session_state.pop("_dataset_fp", None)
 
     # ---------- MYSQL ----------
     with import_tab2:
-        from modules.db_connector import render_database_connector_ui
-        render_database_connector_ui()
+        mods.render_database_connector_ui()
 
     # ---------- SUPABASE ----------
     with import_tab3:
-        from modules.db_connector import render_supabase_connector_ui
-        render_supabase_connector_ui()
+        mods.render_supabase_connector_ui()
 
     # ===================== DATASET VIEW =====================
     if st.session_state.dataset is not None:
         df = st.session_state.dataset
+        overview = _frame_cached("_overview_stats", df, _overview_stats)
 
         st.divider()
         st.subheader("📋 Dataset Overview")
@@ -117,11 +282,8 @@ def main():
         c1, c2, c3, c4 = st.columns(4)
         c1.metric("Rows", f"{len(df):,}")
         c2.metric("Columns", len(df.columns))
-        c3.metric("Missing Values", f"{df.isnull().sum().sum():,}")
-        c4.metric(
-            "Memory",
-            f"{df.memory_usage(deep=True).sum() / 1024**2:.1f} MB"
-        )
+        c3.metric("Missing Values", f"{overview['missing']:,}")
+        c4.metric("Memory", f"{overview['mem_mb']:.1f} MB")
 
         st.subheader("🔍 Data Preview")
 
@@ -136,13 +298,13 @@ def main():
         show_info = st.checkbox("Show column info", key="show_info")
 
         if show_info:
-            st.dataframe(pd.DataFrame({
-                "Column": df.columns,
-                "Type": df.dtypes,
-                "Non-null": df.count(),
-                "Missing": df.isnull().sum(),
-                "Unique": df.nunique()
-            }), use_container_width=True)
+            column_info = overview["column_info"]
+            # nunique hashes every value, so it is opt-in
+            if st.checkbox("Include unique counts", key="show_unique"):
+                column_info = column_info.assign(
+                    Unique=_frame_cached("_unique_counts", df, _unique_counts)
+                )
+            st.dataframe(column_info, use_container_width=True)
 
         st.dataframe(df.head(preview_rows), use_container_width=True)
 
@@ -150,30 +312,30 @@ def main():
         st.divider()
         st.subheader("⚙️ Column Type Configuration")
 
-        type_options = [
-            "continuous", "integer", "ordinal",
-            "categorical", "binary", "text",
-            "datetime", "empty", "unknown"
+        # One data_editor round-trip instead of a selectbox widget per column
+        detected_types = [
+            st.session_state.column_types.get(col, "unknown") for col in df.columns
         ]
+        types_df = pd.DataFrame({
+            "Column": [str(col) for col in df.columns],
+            "Detected": detected_types,
+            "Type": [t if t in TYPE_OPTIONS else "unknown" for t in detected_types]
+        })
+
+        edited_types = st.data_editor(
+            types_df,
+            column_config={
+                "Type": st.column_config.SelectboxColumn(
+                    "Type", options=TYPE_OPTIONS, required=True
+                )
+            },
+            disabled=["Column", "Detected"],
+            hide_index=True,
+            use_container_width=True,
+            key="type_editor"
+        )
 
-        updated_types = {}
-
-        for col in df.columns:
-            cols = st.columns([3, 2, 3])
-            cols[0].write(col)
-            cols[1].write(st.session_state.column_types.get(col, "unknown"))
-
-            selected = cols[2].selectbox(
-                "Type",
-                type_options,
-                index=type_options.index(
-                    st.session_state.column_types.get(col, "unknown")
-                ),
-                key=f"type_{col}",
-                label_visibility="collapsed"
-            )
-
-            updated_types[col] = selected
+        updated_types = dict(zip(df.columns, edited_types["Type"]))
 
         c1, c2 = st.columns(2)
 
@@ -185,12 +347,18 @@ def main():
 
         with c2:
             if st.button("🔍 Start Column Analysis", use_container_width=True):
-                analyzer = ColumnAnalyzer()
+                # Session-scoped instance from initialize_session_state keeps its
+                # analysis cache warm across clicks
+                analyzer = st.session_state.data_analyzer
                 bar = st.progress(0)
+                total = len(df.columns)
+                # Redraw the bar at most ~50 times rather than once per column
+                step = max(1, total // 50)
 
-                for i, col in enumerate(df.columns):
+                for i, col in enumerate(df.columns, start=1):
                     st.session_state.column_analysis[col] = analyzer.analyze_column(df, col)
-                    bar.progress((i + 1) / len(df.columns))
+                    if i % step == 0 or i == total:
+                        bar.progress(i / total)
 
                 st.success("🎉 Column analysis completed!")
 
@@ -205,10 +373,8 @@ def main():
         )
 
         if config_file is not None:
-            from modules.utils import import_configuration
-            content = config_file.read().decode("utf-8")
-
-            if import_configuration(content):
+            # Parsed straight from the uploaded bytes, no separate decode pass
+            if mods.import_configuration(bytes(config_file.getbuffer())):
                 st.success("✅ Configuration imported")
                 st.rerun()
             else:
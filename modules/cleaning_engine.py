@@ -7,6 +7,19 @@ from scipy import stats
 import warnings
 warnings.filterwarnings('ignore')
 
+
+def _fill_missing(series: pd.Series, value: Any) -> pd.Series:
+    """fillna that also works on categoricals, which reject values outside their categories"""
+    if isinstance(series.dtype, pd.CategoricalDtype) and pd.notna(value) and value not in series.cat.categories:
+        series = series.cat.add_categories([value])
+    return series.fillna(value)
+
+
+def _is_text_dtype(series: pd.Series) -> bool:
+    """Object columns and the categoricals optimize_dtypes makes of them"""
+    return series.dtype == 'object' or isinstance(series.dtype, pd.CategoricalDtype)
+
+
 class DataCleaningEngine:
     """Advanced data cleaning engine with column-specific methods and weighted operations"""
     
@@ -83,9 +96,15 @@ class DataCleaningEngine:
     
     def _calculate_impact_stats(self, original: pd.Series, cleaned: pd.Series, weights: Optional[pd.Series] = None) -> Dict[str, Any]:
         """Calculate impact statistics of cleaning operation with optional weighting"""
+        # Categoricals only compare when their categories match, which a fill
+        # that added a category breaks
+        if isinstance(original.dtype, pd.CategoricalDtype) or isinstance(cleaned.dtype, pd.CategoricalDtype):
+            changed = original.astype(object) != cleaned.astype(object)
+        else:
+            changed = original != cleaned
         stats = {
-            'rows_affected': (original != cleaned).sum(),
-            'percentage_changed': ((original != cleaned).sum() / len(original)) * 100,
+            'rows_affected': changed.sum(),
+            'percentage_changed': (changed.sum() / len(original)) * 100,
             'missing_before': original.isnull().sum(),
             'missing_after': cleaned.isnull().sum(),
             'missing_change': cleaned.isnull().sum() - original.isnull().sum()
@@ -177,7 +196,7 @@ class DataCleaningEngine:
             raise ValueError("Cannot calculate mode - all values are missing")
         
         mode_value = mode_values[0]
-        filled_series = series.fillna(mode_value)
+        filled_series = _fill_missing(series, mode_value)
         
         metadata = {
             'method': 'mode_imputation',
@@ -201,7 +220,7 @@ class DataCleaningEngine:
                 mode_values = series.mode()
                 backup_value = mode_values[0] if len(mode_values) > 0 else 'Unknown'
             
-            filled_series = filled_series.fillna(backup_value)
+            filled_series = _fill_missing(filled_series, backup_value)
         
         metadata = {
             'method': 'forward_fill',
@@ -223,7 +242,7 @@ class DataCleaningEngine:
                 mode_values = series.mode()
                 backup_value = mode_values[0] if len(mode_values) > 0 else 'Unknown'
             
-            filled_series = filled_series.fillna(backup_value)
+            filled_series = _fill_missing(filled_series, backup_value)
         
         metadata = {
             'method': 'backward_fill',
@@ -301,7 +320,7 @@ class DataCleaningEngine:
     def _missing_category(self, df: pd.DataFrame, column: str, category_name: str = 'Missing', **kwargs) -> Tuple[pd.Series, Dict[str, Any]]:
         """Create missing category for categorical data"""
         series = df[column].copy()
-        filled_series = series.fillna(category_name)
+        filled_series = _fill_missing(series, category_name)
         
         metadata = {
             'method': 'missing_category',
@@ -620,7 +639,7 @@ class DataCleaningEngine:
         """Trim whitespace from string columns"""
         series = df[column].copy()
         
-        if series.dtype != 'object':
+        if not _is_text_dtype(series):
             raise ValueError("Whitespace trimming only applicable to text columns")
         
         # Convert to string and trim
@@ -640,7 +659,7 @@ class DataCleaningEngine:
         """Standardize text case"""
         series = df[column].copy()
         
-        if series.dtype != 'object':
+        if not _is_text_dtype(series):
             raise ValueError("Case standardization only applicable to text columns")
         
         if case_type == 'lower':
@@ -8,14 +8,24 @@ from sklearn.cluster import DBSCAN
 import streamlit as st
 import hashlib
 import warnings
+import weakref
+from collections import OrderedDict
 warnings.filterwarnings('ignore')
 
+# Column analyses kept per analyzer, most recently used last
+ANALYSIS_CACHE_SIZE = 64
+
 class ColumnAnalyzer:
     """Individual column analysis engine with multiple detection methods"""
     
     def __init__(self):
-        self.analysis_cache = {}
-        self._cached_correlations = {}
+        self.analysis_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Weakref to the frame analysis_cache belongs to; the analyzer lives for
+        # the whole session, and results such as relationships and missing-value
+        # patterns depend on the other columns too
+        self._analysis_frame = None
+        # (weakref to frame, shared per-frame relationship data)
+        self._cached_correlations = None
     
     def analyze_column(self, df: pd.DataFrame, column: str, force_refresh: bool = False) -> Dict[str, Any]:
         """Comprehensive analysis of a single column"""
@@ -26,7 +36,12 @@ class ColumnAnalyzer:
         data_hash = hashlib.sha256(hash_array.tobytes()).hexdigest()[:16]  # Deterministic hash
         cache_key = f"{column}_{len(df)}_{data_hash}"
         
+        if self._analysis_frame is None or self._analysis_frame() is not df:
+            self.analysis_cache.clear()
+            self._analysis_frame = weakref.ref(df)
+        
         if not force_refresh and cache_key in self.analysis_cache:
+            self.analysis_cache.move_to_end(cache_key)
             return self.analysis_cache[cache_key]
         
         series = df[column]
@@ -46,6 +61,9 @@ class ColumnAnalyzer:
         analysis['cleaning_recommendations'] = self._generate_cleaning_recommendations(analysis)
         
         self.analysis_cache[cache_key] = analysis
+        self.analysis_cache.move_to_end(cache_key)
+        while len(self.analysis_cache) > ANALYSIS_CACHE_SIZE:
+            self.analysis_cache.popitem(last=False)
         return analysis
     
     def _get_basic_info(self, series: pd.Series) -> Dict[str, Any]:
@@ -325,14 +343,30 @@ class ColumnAnalyzer:
         series = df[column]
         relationships = {}
         
+        # Numeric column list and pairwise correlations are shared by every
+        # column of the same frame, so a full-frame analysis computes each once.
+        # The weakref identity check means a recycled id() can never match.
+        cached = self._cached_correlations
+        if cached is None or cached[0]() is not df:
+            cached = (weakref.ref(df), {
+                'numeric_cols': df.select_dtypes(include=[np.number]).columns.tolist(),
+                'pairs': {}
+            })
+            self._cached_correlations = cached
+        frame_cache = cached[1]
+        
         # Find numeric columns for correlation analysis
-        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+        numeric_cols = list(frame_cache['numeric_cols'])
         if column in numeric_cols and len(numeric_cols) > 1:
             numeric_cols.remove(column)
             correlations = {}
+            pair_cache = frame_cache['pairs']
             for col in numeric_cols[:10]:  # Limit to top 10 for performance
                 try:
-                    corr = series.corr(df[col])
+                    pair = frozenset((column, col))
+                    if pair not in pair_cache:
+                        pair_cache[pair] = series.corr(df[col])
+                    corr = pair_cache[pair]
                     if pd.notna(corr) and abs(corr) > 0.1:
                         correlations[col] = corr
                 except Exception:
@@ -3,9 +3,255 @@ import numpy as np
 import json
 import ast
 import re
-from typing import Dict, List, Any, Optional, Tuple, Union
+import copy
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Callable, Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime, date, time
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+    pc = None
+
+if ORJSON_AVAILABLE:
+    def _json_loads(value: str) -> Any:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals json.dumps writes
+            return json.loads(value)
+else:
+    _json_loads = json.loads
+
+
+def _json_default(obj: Any) -> Any:
+    """Numpy scalars and arrays as their Python equivalents"""
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj: Any) -> str:
+    # Stdlib dumps keeps the cells' established ', '/': ' formatting; orjson
+    # only writes the compact form
+    return json.dumps(obj, default=_json_default)
+
+
+# Cheap pre-check for numeric date/time shapes (2024-01-31, 31/01/2024, 13:45),
+# anchored so a time-like run inside free text does not count. Dots are left out
+# because none of the declared formats use them (version strings like 1.2.3)
+_DT_SNIFF = re.compile(r'^\s*(?:\d{1,4}[-/]\d{1,2}[-/]\d{1,4}|\d{1,2}:\d{2})')
+
+# A bracketed [...] or braced {...} value, ignoring surrounding whitespace
+_JSON_LIKE = re.compile(r'^\s*(?:\[.*\]|\{.*\})\s*$', re.DOTALL)
+
+# dtype.kind -> detected type for columns whose dtype already settles it
+_DTYPE_KIND_NAMES = {'b': 'boolean', 'i': 'integer', 'u': 'integer', 'f': 'float', 'M': 'datetime'}
+
+# Column-name keywords that mark a merge as date/time related
+_DATE_PART_NAME = re.compile(r'year|month|day|hour|minute|second|date|time')
+
+# Characters that make a multi-character separator a pattern to str.split
+_REGEX_META = re.compile(r'[.^$*+?{}\[\]\\|()]')
+
+
+def _is_pattern_separator(separator: str) -> bool:
+    """Whether str.split would treat the separator as a regex rather than literal text"""
+    return len(separator) > 1 and _REGEX_META.search(separator) is not None
+
+# Leading rows searched for split-preview values before falling back to the whole column
+SPLIT_PREVIEW_SCAN = 256
+
+# Leading non-null values parsed when deciding whether a string column holds dates
+DATETIME_SNIFF_SAMPLE = 32
+
+_DATE_FORMATS = (
+    '%Y-%m-%d', '%d-%m-%Y', '%m-%d-%Y', '%Y/%m/%d', '%d/%m/%Y', '%m/%d/%Y',
+    '%Y%m%d', '%d%m%Y', '%B %d, %Y', '%b %d, %Y', '%d %B %Y', '%d %b %Y'
+)
+
+_TIME_FORMATS = (
+    '%H:%M:%S', '%H:%M', '%I:%M:%S %p', '%I:%M %p', '%H%M%S', '%H%M'
+)
+
+_DATETIME_FORMATS = (
+    '%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%dT%H:%M:%SZ', '%d-%m-%Y %H:%M:%S', '%m-%d-%Y %H:%M:%S',
+    '%Y/%m/%d %H:%M:%S', '%d/%m/%Y %H:%M:%S'
+)
+
+_BOOL_MAP = {
+    'true': True, 'yes': True, '1': True, 't': True, 'y': True,
+    'false': False, 'no': False, '0': False, 'f': False, 'n': False
+}
+
+_DATETIME_PARSE_FORMATS = _DATETIME_FORMATS + _DATE_FORMATS
+_ANY_DATETIME_FORMATS = _DATE_FORMATS + _DATETIME_FORMATS + _TIME_FORMATS
+
+
+def _strptime_match(value: str, formats: Tuple[str, ...]) -> Tuple[Optional[datetime], Optional[str]]:
+    """Parse with the first matching format, returning it too"""
+    for fmt in formats:
+        try:
+            return datetime.strptime(value, fmt), fmt
+        except ValueError:
+            continue
+    return None, None
+
+
+def _strptime_first(value: str, formats: Tuple[str, ...]) -> Optional[datetime]:
+    """Parse with the first matching format"""
+    return _strptime_match(value.strip(), formats)[0]
+
+
+def _strptime_column(values: List[Any], formats: Tuple[str, ...]) -> List[Optional[datetime]]:
+    """
+    Parse one column's strings, trying the format of its first parseable value first
+    
+    Columns are usually written in one format, so this skips the failing formats
+    ahead of it, and repeated values are parsed once. The hint and the memo only
+    live for this call: an ambiguous value such as 01/02/2024 is read the way the
+    rest of its own column is, never the way an earlier column was.
+    """
+    hint = None
+    memo: Dict[str, Optional[datetime]] = {}
+    parsed_values = []
+    for val in values:
+        if not isinstance(val, str):
+            parsed_values.append(None)
+            continue
+        text = val.strip()
+        try:
+            parsed_values.append(memo[text])
+            continue
+        except KeyError:
+            pass
+        parsed = _strptime_match(text, (hint,))[0] if hint is not None else None
+        if parsed is None:
+            parsed, fmt = _strptime_match(text, formats)
+            if hint is None:
+                hint = fmt
+        parsed_values.append(parsed)
+        memo[text] = parsed
+    return parsed_values
+
+
+# Validation results per (frame identity, shape, arguments), most recently used last
+VALIDATION_CACHE_SIZE = 64
+_VALIDATION_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_VALIDATION_LOCK = threading.Lock()
+
+
+def _cached_validation(df: pd.DataFrame, key: tuple, compute) -> Dict[str, Any]:
+    """
+    Return the validation result for this frame and arguments, computing it on a miss
+    
+    Streamlit reruns the page on every widget change while the dataset stays the
+    same object. Entries hold a weak reference to their frame, so a new frame that
+    happens to reuse a freed id() never gets an old answer. Callers get a copy.
+    """
+    full_key = (id(df), df.shape) + key
+    with _VALIDATION_LOCK:
+        entry = _VALIDATION_CACHE.get(full_key)
+        if entry is not None and entry[0]() is df:
+            _VALIDATION_CACHE.move_to_end(full_key)
+            return copy.deepcopy(entry[1])
+    
+    result = compute()
+    with _VALIDATION_LOCK:
+        _VALIDATION_CACHE[full_key] = (weakref.ref(df), result)
+        _VALIDATION_CACHE.move_to_end(full_key)
+        while len(_VALIDATION_CACHE) > VALIDATION_CACHE_SIZE:
+            _VALIDATION_CACHE.popitem(last=False)
+    return copy.deepcopy(result)
+
+
+def _parse_json(value: str) -> Any:
+    """JSON, then Python-literal parse of a string; the string itself if neither fits"""
+    try:
+        # orjson's decode error subclasses json.JSONDecodeError
+        return _json_loads(value)
+    except (json.JSONDecodeError, TypeError):
+        try:
+            return ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return value
+
+
+def _memoized_for_operation(func: Callable[[str], Any]) -> Callable[[str], Any]:
+    """
+    Return func memoized for the lifetime of one operation
+    
+    Columns repeat values, so each distinct string is parsed once. The memo is
+    local to the caller, so no cell value outlives the operation or is shared
+    between sessions.
+    """
+    memo: Dict[str, Any] = {}
+    
+    def parse(value: str) -> Any:
+        try:
+            return memo[value]
+        except KeyError:
+            parsed = memo[value] = func(value)
+            return parsed
+    
+    return parse
+
+
+def _json_parser() -> Callable[[str], Any]:
+    """
+    Return a _parse_json memoized for the lifetime of one operation
+    
+    Equal strings share one parsed object, so callers copy a container before
+    storing it as a cell.
+    """
+    return _memoized_for_operation(_parse_json)
+
+
+def _is_missing(val: Any) -> bool:
+    """pd.isna for one cell that may hold a list or dict (pd.isna would return an array)"""
+    return val is None or val is pd.NA or val is pd.NaT or (isinstance(val, float) and val != val)
+
+
+def _to_list_value(val: Any, parse: Callable[[str], Any]) -> Optional[list]:
+    if isinstance(val, list):
+        return val
+    if isinstance(val, str):
+        parsed = parse(val)
+        # Copy so cells parsed from equal strings don't share one list
+        return list(parsed) if isinstance(parsed, list) else [val]
+    if _is_missing(val):
+        return None
+    return [val]
+
+
+def _to_dict_value(val: Any, parse: Callable[[str], Any]) -> Optional[dict]:
+    if isinstance(val, dict):
+        return val
+    if isinstance(val, str):
+        parsed = parse(val)
+        return dict(parsed) if isinstance(parsed, dict) else None
+    return None
+
+
+def _to_datetime_single(value: str) -> Optional[datetime]:
+    """pd.to_datetime for a single string"""
+    parsed = pd.to_datetime(value, errors='coerce')
+    return parsed.to_pydatetime() if pd.notna(parsed) else None
+
 
 class DataTransformer:
     
@@ -15,29 +261,33 @@ class DataTransformer:
         'complex', 'timedelta', 'object'
     ]
     
-    DATE_FORMATS = [
-        '%Y-%m-%d', '%d-%m-%Y', '%m-%d-%Y', '%Y/%m/%d', '%d/%m/%Y', '%m/%d/%Y',
-        '%Y%m%d', '%d%m%Y', '%B %d, %Y', '%b %d, %Y', '%d %B %Y', '%d %b %Y'
-    ]
+    DATE_FORMATS = list(_DATE_FORMATS)
     
-    TIME_FORMATS = [
-        '%H:%M:%S', '%H:%M', '%I:%M:%S %p', '%I:%M %p', '%H%M%S', '%H%M'
-    ]
+    TIME_FORMATS = list(_TIME_FORMATS)
     
-    DATETIME_FORMATS = [
-        '%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%dT%H:%M:%S',
-        '%Y-%m-%dT%H:%M:%SZ', '%d-%m-%Y %H:%M:%S', '%m-%d-%Y %H:%M:%S',
-        '%Y/%m/%d %H:%M:%S', '%d/%m/%Y %H:%M:%S'
-    ]
+    DATETIME_FORMATS = list(_DATETIME_FORMATS)
+    
+    # Split component -> Series.dt attribute ('week' goes through isocalendar())
+    DATETIME_COMPONENTS = {
+        'year': 'year', 'month': 'month', 'day': 'day',
+        'hour': 'hour', 'minute': 'minute', 'second': 'second',
+        'weekday': 'weekday', 'week': 'week', 'quarter': 'quarter',
+        'dayofyear': 'dayofyear', 'date': 'date', 'time': 'time'
+    }
     
     def __init__(self):
         self.operation_history = []
     
     def detect_column_dtype(self, series: pd.Series) -> str:
-        if series.dropna().empty:
-            return 'object'
+        # Typed numeric/bool/datetime columns need no sampling at all
+        kind_name = _DTYPE_KIND_NAMES.get(series.dtype.kind)
+        if kind_name is not None:
+            return kind_name if series.notna().any() else 'object'
         
-        sample = series.dropna()
+        # Drop missing values at most once, and not at all for NaN-free columns
+        sample = series.dropna() if series.hasnans else series
+        if sample.empty:
+            return 'object'
         
         if pd.api.types.is_datetime64_any_dtype(series):
             return 'datetime'
@@ -55,7 +305,7 @@ class DataTransformer:
             return 'categorical'
         
         if series.dtype == 'object':
-            first_valid = sample.iloc[0] if len(sample) > 0 else None
+            first_valid = sample.iat[0]
             
             if isinstance(first_valid, (list, np.ndarray)):
                 return 'list'
@@ -71,7 +321,15 @@ class DataTransformer:
                     if isinstance(parsed, dict):
                         return 'dictionary'
                 
-                if self._is_datetime_string(first_valid):
+                if _DT_SNIFF.match(first_valid):
+                    # Check a small sample against the declared formats; format='mixed'
+                    # would fall back to dateutil, which accepts codes like 3-4-5
+                    check_sample = sample.head(DATETIME_SNIFF_SAMPLE).tolist()
+                    hits = sum(self._is_datetime_string(v) for v in check_sample)
+                    if hits > 0.8 * len(check_sample):
+                        return 'datetime'
+                elif self._is_datetime_string(first_valid):
+                    # Named-month formats the sniff does not cover
                     return 'datetime'
             
             return 'string'
@@ -79,63 +337,34 @@ class DataTransformer:
         return 'object'
     
     def _is_json_like(self, value: str) -> bool:
-        if not isinstance(value, str):
-            return False
-        value = value.strip()
-        return (value.startswith('[') and value.endswith(']')) or \
-               (value.startswith('{') and value.endswith('}'))
+        return isinstance(value, str) and _JSON_LIKE.match(value) is not None
     
     def _try_parse_json(self, value: str) -> Any:
         if not isinstance(value, str):
             return value
-        try:
-            return json.loads(value)
-        except (json.JSONDecodeError, TypeError):
-            try:
-                return ast.literal_eval(value)
-            except (ValueError, SyntaxError):
-                return value
+        return _parse_json(value)
     
     def _is_datetime_string(self, value: str) -> bool:
         if not isinstance(value, str):
             return False
-        for fmt in self.DATE_FORMATS + self.DATETIME_FORMATS + self.TIME_FORMATS:
-            try:
-                datetime.strptime(value.strip(), fmt)
-                return True
-            except ValueError:
-                continue
-        return False
+        return _strptime_first(value, _ANY_DATETIME_FORMATS) is not None
     
     def _parse_datetime(self, value: str) -> Optional[datetime]:
         if not isinstance(value, str):
             return None
-        for fmt in self.DATETIME_FORMATS + self.DATE_FORMATS:
-            try:
-                return datetime.strptime(value.strip(), fmt)
-            except ValueError:
-                continue
-        return None
+        return _strptime_first(value, _DATETIME_PARSE_FORMATS)
     
     def _parse_date(self, value: str) -> Optional[date]:
         if not isinstance(value, str):
             return None
-        for fmt in self.DATE_FORMATS:
-            try:
-                return datetime.strptime(value.strip(), fmt).date()
-            except ValueError:
-                continue
-        return None
+        parsed = _strptime_first(value, _DATE_FORMATS)
+        return parsed.date() if parsed else None
     
     def _parse_time(self, value: str) -> Optional[time]:
         if not isinstance(value, str):
             return None
-        for fmt in self.TIME_FORMATS:
-            try:
-                return datetime.strptime(value.strip(), fmt).time()
-            except ValueError:
-                continue
-        return None
+        parsed = _strptime_first(value, _TIME_FORMATS)
+        return parsed.time() if parsed else None
     
     def merge_columns(
         self,
@@ -148,8 +377,6 @@ class DataTransformer:
         is_datetime_merge: bool = False,
         datetime_format: Optional[str] = None
     ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
-        result_df = df.copy()
-        
         if not all(col in df.columns for col in columns):
             missing_cols = [col for col in columns if col not in df.columns]
             return df, {'success': False, 'error': f'Columns not found: {missing_cols}'}
@@ -160,6 +387,8 @@ class DataTransformer:
         if len(separators) != len(columns) - 1:
             return df, {'success': False, 'error': 'Number of separators must be one less than columns'}
         
+        result_df = df.copy(deep=False)
+        
         try:
             if is_datetime_merge:
                 merged = self._merge_datetime_columns(
@@ -195,35 +424,46 @@ class DataTransformer:
         separators: List[str],
         handle_missing: str
     ) -> pd.Series:
-        def merge_row(row):
-            values = []
-            for i, col in enumerate(columns):
-                val = row[col]
-                if pd.isna(val):
-                    if handle_missing == 'skip':
-                        continue
-                    elif handle_missing == 'empty':
-                        values.append('')
-                    elif handle_missing == 'null_string':
-                        values.append('NULL')
-                    else:
-                        return np.nan
-                else:
-                    values.append(str(val))
-            
-            if not values:
-                return np.nan
+        # Build the merged strings column by column instead of row by row.
+        # Separators follow the position among the values actually merged into
+        # a row, so skipped missing values do not leave doubled separators.
+        n_rows = len(df)
+        seps = np.array(separators, dtype=object)
+        result = np.full(n_rows, np.nan, dtype=object)
+        merged_count = np.zeros(n_rows, dtype=np.int64)
+        voided = np.zeros(n_rows, dtype=bool)
+        fill_value = {'empty': '', 'null_string': 'NULL'}.get(handle_missing)
+        
+        for col in columns:
+            series = df[col]
+            present = series.notna().to_numpy()
+            strings = np.empty(n_rows, dtype=object)
+            strings[present] = [str(v) for v in series.to_numpy(dtype=object)[present]]
             
-            result = values[0]
-            for i, val in enumerate(values[1:]):
-                sep = separators[min(i, len(separators) - 1)]
-                result = result + sep + val
+            if handle_missing == 'skip':
+                take = present
+            elif fill_value is not None:
+                strings[~present] = fill_value
+                take = np.ones(n_rows, dtype=bool)
+            else:
+                voided |= ~present
+                take = present
             
-            return result
+            first = take & (merged_count == 0)
+            rest = take & (merged_count > 0)
+            result[first] = strings[first]
+            if rest.any():
+                sep_idx = np.minimum(merged_count[rest] - 1, len(seps) - 1)
+                result[rest] = result[rest] + seps[sep_idx] + strings[rest]
+            merged_count[take] += 1
         
-        return df.apply(merge_row, axis=1)
+        result[voided] = np.nan
+        # Wrap the finished buffer as-is; object dtype is what the text-column checks
+        # elsewhere in the app expect
+        return pd.Series(result, index=df.index, dtype=object, copy=False)
     
-    def _parse_datetime_value(self, val: Any) -> Optional[datetime]:
+    def _parse_datetime_value(self, val: Any,
+                              parse: Callable[[str], Optional[datetime]] = _to_datetime_single) -> Optional[datetime]:
         if pd.isna(val):
             return None
         
@@ -244,9 +484,7 @@ class DataTransformer:
         
         if isinstance(val, str):
             try:
-                parsed = pd.to_datetime(val, errors='coerce')
-                if pd.notna(parsed):
-                    return parsed.to_pydatetime()
+                return parse(val)
             except Exception:
                 pass
         
@@ -259,51 +497,43 @@ class DataTransformer:
         separators: List[str],
         output_format: Optional[str]
     ) -> pd.Series:
-        def merge_datetime_row(row):
+        merged = self._merge_datetime_vectorized(df, columns)
+        if merged is not None:
+            if output_format:
+                # Same round trip through the formatted strings as the row path
+                return pd.to_datetime(merged.dt.strftime(output_format), errors='coerce')
+            return merged
+        
+        if not all(isinstance(col, str) for col in columns):
+            return pd.Series(pd.NaT, index=df.index, dtype='datetime64[ns]')
+        # Roles depend only on the column names, so classify them once
+        roles = [self._datetime_role(col) for col in columns]
+        # Per-operation memos: rows repeat date and time strings
+        parse_datetime = _memoized_for_operation(_to_datetime_single)
+        parse_time = _memoized_for_operation(self._parse_time)
+        
+        def merge_datetime_row(values):
             try:
                 date_parts = {}
                 time_parts = {}
                 parsed_datetimes = []
                 
-                for col in columns:
-                    val = row[col]
+                for role, val in zip(roles, values):
                     if pd.isna(val):
                         continue
                     
-                    col_lower = col.lower()
-                    
-                    if 'year' in col_lower:
-                        try:
-                            date_parts['year'] = int(float(str(val).strip()))
-                        except (ValueError, TypeError):
-                            pass
-                    elif 'month' in col_lower:
-                        try:
-                            date_parts['month'] = int(float(str(val).strip()))
-                        except (ValueError, TypeError):
-                            pass
-                    elif 'day' in col_lower and 'weekday' not in col_lower:
+                    if role in ('year', 'month', 'day'):
                         try:
-                            date_parts['day'] = int(float(str(val).strip()))
+                            date_parts[role] = int(float(str(val).strip()))
                         except (ValueError, TypeError):
                             pass
-                    elif 'hour' in col_lower:
+                    elif role in ('hour', 'minute', 'second'):
                         try:
-                            time_parts['hour'] = int(float(str(val).strip()))
+                            time_parts[role] = int(float(str(val).strip()))
                         except (ValueError, TypeError):
                             pass
-                    elif 'minute' in col_lower or 'min' in col_lower:
-                        try:
-                            time_parts['minute'] = int(float(str(val).strip()))
-                        except (ValueError, TypeError):
-                            pass
-                    elif 'second' in col_lower or 'sec' in col_lower:
-                        try:
-                            time_parts['second'] = int(float(str(val).strip()))
-                        except (ValueError, TypeError):
-                            pass
-                    elif 'date' in col_lower or 'datetime' in col_lower:
-                        parsed_dt = self._parse_datetime_value(val)
+                    elif role == 'date':
+                        parsed_dt = self._parse_datetime_value(val, parse_datetime)
                         if parsed_dt:
                             date_parts.update({
                                 'year': parsed_dt.year,
@@ -317,8 +547,8 @@ class DataTransformer:
                                     'second': parsed_dt.second
                                 })
                             parsed_datetimes.append(parsed_dt)
-                    elif 'time' in col_lower:
-                        parsed_dt = self._parse_datetime_value(val)
+                    elif role == 'time':
+                        parsed_dt = self._parse_datetime_value(val, parse_datetime)
                         if parsed_dt:
                             time_parts.update({
                                 'hour': parsed_dt.hour,
@@ -326,7 +556,7 @@ class DataTransformer:
                                 'second': parsed_dt.second
                             })
                         else:
-                            parsed_time = self._parse_time(str(val).strip())
+                            parsed_time = parse_time(str(val).strip())
                             if parsed_time:
                                 time_parts.update({
                                     'hour': parsed_time.hour,
@@ -334,7 +564,7 @@ class DataTransformer:
                                     'second': parsed_time.second
                                 })
                     else:
-                        parsed_dt = self._parse_datetime_value(val)
+                        parsed_dt = self._parse_datetime_value(val, parse_datetime)
                         if parsed_dt:
                             parsed_datetimes.append(parsed_dt)
                 
@@ -387,12 +617,105 @@ class DataTransformer:
             except Exception:
                 return pd.NaT
         
-        result_series = df.apply(merge_datetime_row, axis=1)
+        # Plain tuples per row rather than the Series that apply(axis=1) builds
+        result_series = pd.Series(
+            [merge_datetime_row(values) for values in zip(*(df[col].tolist() for col in columns))],
+            index=df.index,
+            dtype=object
+        )
         try:
             return pd.to_datetime(result_series, errors='coerce')
         except Exception:
             return result_series
     
+    @staticmethod
+    def _datetime_role(column: str) -> str:
+        """Classify a column for datetime merges by its name (same precedence as the row path)"""
+        col_lower = column.lower()
+        if 'year' in col_lower:
+            return 'year'
+        if 'month' in col_lower:
+            return 'month'
+        if 'day' in col_lower and 'weekday' not in col_lower:
+            return 'day'
+        if 'hour' in col_lower:
+            return 'hour'
+        if 'minute' in col_lower or 'min' in col_lower:
+            return 'minute'
+        if 'second' in col_lower or 'sec' in col_lower:
+            return 'second'
+        if 'date' in col_lower or 'datetime' in col_lower:
+            return 'date'
+        if 'time' in col_lower:
+            return 'time'
+        return 'other'
+    
+    def _datetime_series(self, series: pd.Series) -> Optional[pd.Series]:
+        """Parse a whole naive-datetime or string column at once; None if it is neither"""
+        if pd.api.types.is_datetime64_dtype(series):
+            return series
+        if pd.api.types.infer_dtype(series, skipna=True) == 'string':
+            return pd.to_datetime(series, errors='coerce', format='mixed')
+        return None
+    
+    def _merge_datetime_vectorized(self, df: pd.DataFrame, columns: List[str]) -> Optional[pd.Series]:
+        """
+        Column-wise datetime merge for the common layouts: separate year/month/day
+        (and optional hour/minute/second) columns, or a date column followed by a
+        time column. Returns None for anything else, which takes the row path.
+        """
+        if not all(isinstance(col, str) for col in columns):
+            return None
+        roles = [self._datetime_role(col) for col in columns]
+        
+        part_roles = {'year', 'month', 'day', 'hour', 'minute', 'second'}
+        if set(roles) <= part_roles and len(set(roles)) == len(roles) \
+                and {'year', 'month', 'day'} <= set(roles):
+            parts = {}
+            for col, role in zip(columns, roles):
+                series = df[col]
+                if pd.api.types.is_bool_dtype(series):
+                    return None
+                if not pd.api.types.is_numeric_dtype(series):
+                    series = series.astype(str).str.strip()
+                parts[role] = np.trunc(pd.to_numeric(series, errors='coerce'))
+            
+            # Out-of-range clock values make the row invalid rather than rolling over
+            limits = {'hour': 23, 'minute': 59, 'second': 59}
+            invalid = pd.Series(False, index=df.index)
+            for role, limit in limits.items():
+                if role in parts:
+                    invalid |= (parts[role] < 0) | (parts[role] > limit)
+                    parts[role] = parts[role].fillna(0)
+            
+            merged = pd.to_datetime(pd.DataFrame(parts), errors='coerce')
+            return merged.mask(invalid)
+        
+        if roles == ['date', 'time']:
+            date_col, time_col = columns
+            dates = self._datetime_series(df[date_col])
+            times = self._datetime_series(df[time_col])
+            if dates is None or times is None:
+                return None
+            time_of_day = times - times.dt.normalize()
+            
+            # Compact clock strings ('1230') the parser rejects go through strptime
+            unparsed = time_of_day.isna() & df[time_col].notna()
+            if unparsed.any():
+                parsed = [
+                    t.time() if t else None
+                    for t in _strptime_column(df.loc[unparsed, time_col].tolist(), _TIME_FORMATS)
+                ]
+                time_of_day[unparsed] = pd.to_timedelta(
+                    [f"{t.hour}:{t.minute}:{t.second}" if t else None for t in parsed]
+                )
+            
+            # Without a usable time the date keeps its own time of day
+            time_of_day = time_of_day.fillna(dates - dates.dt.normalize())
+            return (dates.dt.normalize() + time_of_day).dt.floor('s')
+        
+        return None
+    
     def split_column(
         self,
         df: pd.DataFrame,
@@ -403,11 +726,11 @@ class DataTransformer:
         is_datetime_split: bool = False,
         datetime_components: Optional[List[str]] = None
     ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
-        result_df = df.copy()
-        
         if column not in df.columns:
             return df, {'success': False, 'error': f'Column not found: {column}'}
         
+        result_df = df.copy(deep=False)
+        
         prefix = new_column_prefix or f"{column}_part"
         
         try:
@@ -445,8 +768,16 @@ class DataTransformer:
         prefix: str,
         max_splits: int
     ) -> Tuple[List[pd.Series], List[str]]:
+        if separator and PYARROW_AVAILABLE and len(series) > 0:
+            new_cols = self._split_with_arrow(series, separator, max_splits)
+            if new_cols is not None:
+                return new_cols, [f"{prefix}_{i+1}" for i in range(len(new_cols))]
+        
         if separator:
-            split_df = series.astype(str).str.split(separator, expand=True, n=max_splits if max_splits > 0 else None)
+            split_df = series.astype(str).str.split(
+                separator, expand=True, n=max_splits if max_splits > 0 else None,
+                regex=_is_pattern_separator(separator)
+            )
         else:
             split_df = series.astype(str).str.split(expand=True)
         
@@ -455,43 +786,83 @@ class DataTransformer:
         
         return new_cols, col_names
     
+    def _split_with_arrow(
+        self,
+        series: pd.Series,
+        separator: str,
+        max_splits: int
+    ) -> Optional[List[pd.Series]]:
+        """
+        Literal-separator split in Arrow's native kernels, padded with None like
+        str.split(expand=True). None when the separator would be a regex to pandas
+        (longer than one character with metacharacters) or Arrow rejects the data.
+        """
+        if _is_pattern_separator(separator):
+            return None
+        try:
+            parts = pc.split_pattern(
+                pa.array(series.astype(str).tolist(), type=pa.string()),
+                pattern=separator,
+                max_splits=max_splits if max_splits > 0 else None
+            )
+            lengths = pc.list_value_length(parts)
+            width = pc.max(lengths).as_py() or 0
+            
+            new_cols = []
+            for i in range(width):
+                # Lists too short for this position become null instead of raising
+                padded = pc.if_else(pc.greater(lengths, i), parts, pa.scalar(None, parts.type))
+                values = pc.list_element(padded, i).to_numpy(zero_copy_only=False)
+                new_cols.append(pd.Series(values, index=series.index, dtype=object))
+            return new_cols
+        except (pa.ArrowException, TypeError, ValueError):
+            return None
+    
     def _split_datetime_column(
         self,
         series: pd.Series,
         components: List[str]
     ) -> Tuple[List[pd.Series], List[str]]:
-        try:
-            dt_series = pd.to_datetime(series, errors='coerce')
-        except Exception:
-            dt_series = series.apply(lambda x: self._parse_datetime(str(x)) if pd.notna(x) else None)
-            dt_series = pd.to_datetime(dt_series, errors='coerce')
+        if pd.api.types.is_datetime64_any_dtype(series):
+            dt_series = series
+        else:
+            try:
+                dt_series = pd.to_datetime(series, errors='coerce', format='mixed')
+            except (ValueError, TypeError):
+                dt_series = pd.to_datetime(series, errors='coerce')
+            # Mostly unparsed: fill the gaps one explicit format at a time
+            if dt_series.isna().sum() > series.notna().sum() / 2:
+                as_text = series.astype('string').str.strip().reset_index(drop=True)
+                filled = dt_series.reset_index(drop=True)
+                for fmt in _DATETIME_PARSE_FORMATS:
+                    missing = filled.isna() & as_text.notna()
+                    if not missing.any():
+                        break
+                    filled = filled.fillna(
+                        pd.to_datetime(as_text[missing], errors='coerce', format=fmt)
+                    )
+                dt_series = filled.set_axis(series.index)
         
         new_cols = []
         col_names = []
         
-        component_map = {
-            'year': lambda dt: dt.dt.year,
-            'month': lambda dt: dt.dt.month,
-            'day': lambda dt: dt.dt.day,
-            'hour': lambda dt: dt.dt.hour,
-            'minute': lambda dt: dt.dt.minute,
-            'second': lambda dt: dt.dt.second,
-            'weekday': lambda dt: dt.dt.weekday,
-            'week': lambda dt: dt.dt.isocalendar().week,
-            'quarter': lambda dt: dt.dt.quarter,
-            'dayofyear': lambda dt: dt.dt.dayofyear,
-            'date': lambda dt: dt.dt.date,
-            'time': lambda dt: dt.dt.time
-        }
-        
         for comp in components:
-            if comp in component_map:
-                new_cols.append(component_map[comp](dt_series))
-                col_names.append(comp)
+            attr = self.DATETIME_COMPONENTS.get(comp)
+            if attr is None:
+                continue
+            if attr == 'week':
+                new_cols.append(dt_series.dt.isocalendar().week)
+            else:
+                new_cols.append(getattr(dt_series.dt, attr))
+            col_names.append(comp)
         
         return new_cols, col_names
     
-    def detect_json_columns(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def detect_json_columns(
+        self,
+        df: pd.DataFrame,
+        sample_rows: Optional[int] = 100
+    ) -> List[Dict[str, Any]]:
         json_columns = []
         
         for col in df.columns:
@@ -499,44 +870,27 @@ class DataTransformer:
             if len(sample) == 0:
                 continue
             
-            json_count = 0
-            sample_parsed = []
-            all_keys = set()
-            
-            check_sample = sample.head(100)
-            
-            for val in check_sample:
-                if isinstance(val, str) and self._is_json_like(val):
-                    parsed = self._try_parse_json(val)
-                    if isinstance(parsed, (dict, list)):
-                        json_count += 1
-                        sample_parsed.append(parsed)
-                        
-                        if isinstance(parsed, dict):
-                            all_keys.update(parsed.keys())
-                        elif isinstance(parsed, list) and parsed:
-                            if isinstance(parsed[0], dict):
-                                for item in parsed:
-                                    if isinstance(item, dict):
-                                        all_keys.update(item.keys())
-                elif isinstance(val, (dict, list)):
-                    json_count += 1
-                    sample_parsed.append(val)
-                    
-                    if isinstance(val, dict):
-                        all_keys.update(val.keys())
-                    elif isinstance(val, list) and val:
-                        if isinstance(val[0], dict):
-                            for item in val:
-                                if isinstance(item, dict):
-                                    all_keys.update(item.keys())
+            check_sample = sample if sample_rows is None else sample.head(sample_rows)
+            parse = _json_parser()
+            
+            # One pass over plain Python objects; strings that don't look like JSON
+            # stay strings and drop out with everything else that isn't a container
+            parsed_values = (
+                parse(val) if isinstance(val, str) and self._is_json_like(val) else val
+                for val in check_sample.tolist()
+            )
+            sample_parsed = [p for p in parsed_values if isinstance(p, (dict, list))]
             
+            json_count = len(sample_parsed)
             if json_count / len(check_sample) > 0.5:
+                # Keys come from dicts and from lists of dicts (judged by the first item)
+                record_lists = [p for p in sample_parsed if isinstance(p, list) and p and isinstance(p[0], dict)]
+                dicts = [p for p in sample_parsed if isinstance(p, dict)]
+                dicts.extend(item for lst in record_lists for item in lst if isinstance(item, dict))
+                all_keys = set().union(*dicts)
+                
                 is_array = any(isinstance(p, list) for p in sample_parsed)
-                is_nested = is_array and any(
-                    isinstance(p, list) and p and isinstance(p[0], dict) 
-                    for p in sample_parsed
-                )
+                is_nested = bool(record_lists)
                 
                 json_columns.append({
                     'column': col,
@@ -557,26 +911,26 @@ class DataTransformer:
         explode_arrays: bool = False,
         prefix: Optional[str] = None
     ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
-        result_df = df.copy()
-        
         if column not in df.columns:
             return df, {'success': False, 'error': f'Column not found: {column}'}
         
+        result_df = df.copy(deep=False)
+        
         prefix = prefix or column
         
         try:
-            def parse_and_extract(val):
-                if pd.isna(val):
-                    return None
-                
+            parse_json = _json_parser()
+            
+            def parse_value(val):
                 if isinstance(val, str):
-                    parsed = self._try_parse_json(val)
-                else:
-                    parsed = val
-                
-                return parsed
+                    return parse_json(val)
+                # Scalar missing markers; containers pass through unchanged
+                if _is_missing(val):
+                    return None
+                return val
             
-            parsed_series = df[column].apply(parse_and_extract)
+            parsed_series = pd.Series([parse_value(val) for val in df[column].tolist()],
+                                      index=df.index, dtype=object)
             
             if explode_arrays:
                 def expand_array(val):
@@ -591,17 +945,21 @@ class DataTransformer:
                 parsed_series = result_df['_temp_expanded']
                 result_df = result_df.drop(columns=['_temp_expanded'])
             
+            def extract_from_list(val, k):
+                if isinstance(val, list) and val and isinstance(val[0], dict):
+                    values = [item.get(k) for item in val if isinstance(item, dict)]
+                    return values if values else None
+                return None
+            
+            # One materialized list, then a comprehension per key instead of a
+            # Series.apply per key
+            parsed_list = parsed_series.tolist()
             for key in keys_to_extract:
-                def extract_key(val, k=key):
-                    if isinstance(val, dict):
-                        return val.get(k)
-                    elif isinstance(val, list) and val:
-                        if isinstance(val[0], dict):
-                            values = [item.get(k) for item in val if isinstance(item, dict)]
-                            return values if values else None
-                    return None
-                
-                result_df[f"{prefix}_{key}"] = parsed_series.apply(extract_key)
+                result_df[f"{prefix}_{key}"] = pd.array(
+                    [val.get(key) if isinstance(val, dict) else extract_from_list(val, key)
+                     for val in parsed_list],
+                    dtype=object
+                )
             
             new_columns = [f"{prefix}_{key}" for key in keys_to_extract]
             
@@ -629,33 +987,30 @@ class DataTransformer:
         group_by: Optional[str] = None,
         as_array: bool = False
     ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
-        result_df = df.copy()
-        
         missing_cols = [col for col in columns if col not in df.columns]
         if missing_cols:
             return df, {'success': False, 'error': f'Columns not found: {missing_cols}'}
         
+        result_df = df.copy(deep=False)
+        
         try:
+            # One to_dict pass (NaN -> None, numpy scalars -> Python) instead of
+            # building a Series per row or a DataFrame per group
+            subset = result_df[columns].astype(object)
+            records = subset.where(subset.notna(), None).to_dict('records')
+            
             if group_by and group_by in df.columns:
-                def create_grouped_json(group):
-                    records = group[columns].to_dict('records')
-                    return json.dumps(records) if as_array else json.dumps(records[0] if records else {})
-                
-                grouped = result_df.groupby(group_by).apply(
-                    lambda g: g[columns].to_dict('records')
-                ).reset_index()
-                grouped.columns = [group_by, new_column_name]
-                
-                result_df = result_df.merge(grouped, on=group_by, how='left')
-                result_df[new_column_name] = result_df[new_column_name].apply(json.dumps)
+                # Group positions slice the shared records; each group is serialized once
+                # and written straight to its rows (missing group keys stay NaN)
+                grouped_json = np.full(len(result_df), np.nan, dtype=object)
+                for positions in result_df.groupby(group_by).indices.values():
+                    grouped_json[positions] = _json_dumps([records[i] for i in positions])
+                result_df[new_column_name] = grouped_json
             else:
-                def row_to_json(row):
-                    data = {col: row[col] if pd.notna(row[col]) else None for col in columns}
-                    if as_array:
-                        return json.dumps([data])
-                    return json.dumps(data)
-                
-                result_df[new_column_name] = result_df.apply(row_to_json, axis=1)
+                if as_array:
+                    result_df[new_column_name] = [_json_dumps([record]) for record in records]
+                else:
+                    result_df[new_column_name] = [_json_dumps(record) for record in records]
             
             operation_info = {
                 'success': True,
@@ -680,11 +1035,11 @@ class DataTransformer:
         datetime_format: Optional[str] = None,
         errors: str = 'coerce'
     ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
-        result_df = df.copy()
-        
         if column not in df.columns:
             return df, {'success': False, 'error': f'Column not found: {column}'}
         
+        result_df = df.copy(deep=False)
+        
         try:
             series = result_df[column]
             original_dtype = str(series.dtype)
@@ -696,7 +1051,9 @@ class DataTransformer:
                 result_df[column] = pd.to_numeric(series, errors=errors)
             
             elif target_dtype == 'string':
-                result_df[column] = series.astype(str).replace('nan', pd.NA)
+                # StringDtype keeps missing cells as pd.NA; stored back as object because
+                # the analysis pages branch on dtype == 'object' for text columns
+                result_df[column] = series.astype('string').astype(object)
             
             elif target_dtype == 'boolean':
                 def to_bool(val):
@@ -707,13 +1064,22 @@ class DataTransformer:
                     if isinstance(val, (int, float)):
                         return bool(val)
                     if isinstance(val, str):
-                        lower = val.lower().strip()
-                        if lower in ['true', 'yes', '1', 't', 'y']:
-                            return True
-                        elif lower in ['false', 'no', '0', 'f', 'n']:
-                            return False
+                        return _BOOL_MAP.get(val.lower().strip(), pd.NA)
                     return pd.NA
-                result_df[column] = series.apply(to_bool)
+                
+                if pd.api.types.is_bool_dtype(series):
+                    result_df[column] = series.astype('boolean')
+                elif pd.api.types.is_numeric_dtype(series):
+                    result_df[column] = series.ne(0).astype('boolean').mask(series.isna())
+                else:
+                    mapped = series.astype('string').str.strip().str.lower().map(_BOOL_MAP)
+                    # Non-string cells (ints, floats, bools in object columns) that the
+                    # string lookup missed go through the scalar rules
+                    leftover = mapped.isna() & series.notna()
+                    if leftover.any():
+                        mapped = mapped.astype(object)
+                        mapped[leftover] = series[leftover].map(to_bool)
+                    result_df[column] = mapped.astype('boolean')
             
             elif target_dtype == 'datetime':
                 if datetime_format:
@@ -733,31 +1099,12 @@ class DataTransformer:
                 result_df[column] = pd.Categorical(series)
             
             elif target_dtype == 'list':
-                def to_list(val):
-                    if pd.isna(val):
-                        return None
-                    if isinstance(val, list):
-                        return val
-                    if isinstance(val, str):
-                        parsed = self._try_parse_json(val)
-                        if isinstance(parsed, list):
-                            return parsed
-                        return [val]
-                    return [val]
-                result_df[column] = series.apply(to_list)
+                parse = _json_parser()
+                result_df[column] = pd.array([_to_list_value(val, parse) for val in series.tolist()], dtype=object)
             
             elif target_dtype == 'dictionary':
-                def to_dict(val):
-                    if pd.isna(val):
-                        return None
-                    if isinstance(val, dict):
-                        return val
-                    if isinstance(val, str):
-                        parsed = self._try_parse_json(val)
-                        if isinstance(parsed, dict):
-                            return parsed
-                    return None
-                result_df[column] = series.apply(to_dict)
+                parse = _json_parser()
+                result_df[column] = pd.array([_to_dict_value(val, parse) for val in series.tolist()], dtype=object)
             
             conversion_success = result_df[column].notna().sum()
             conversion_failed = result_df[column].isna().sum() - series.isna().sum()
@@ -782,7 +1129,28 @@ class DataTransformer:
         self,
         df: pd.DataFrame,
         columns: List[str],
-        is_datetime: bool = False
+        is_datetime: bool = False,
+        *,
+        include_dtypes: bool = True,
+        include_missing: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Existence checks plus, unless switched off, per-column detected dtypes
+        ('dtype_info') and warnings for columns that are mostly missing.
+        """
+        return _cached_validation(
+            df,
+            ('merge', tuple(columns), is_datetime, include_dtypes, include_missing),
+            lambda: self._validate_merge_columns(df, columns, is_datetime, include_dtypes, include_missing)
+        )
+    
+    def _validate_merge_columns(
+        self,
+        df: pd.DataFrame,
+        columns: List[str],
+        is_datetime: bool,
+        include_dtypes: bool,
+        include_missing: bool
     ) -> Dict[str, Any]:
         validation = {
             'valid': True,
@@ -791,25 +1159,28 @@ class DataTransformer:
             'dtype_info': {}
         }
         
+        available = set(df.columns)
+        present = []
         for col in columns:
-            if col not in df.columns:
+            if col not in available:
                 validation['errors'].append(f"Column '{col}' not found")
                 validation['valid'] = False
-                continue
-            
-            dtype = self.detect_column_dtype(df[col])
-            validation['dtype_info'][col] = dtype
-            
-            missing_pct = df[col].isna().mean() * 100
-            if missing_pct > 50:
-                validation['warnings'].append(f"Column '{col}' has {missing_pct:.1f}% missing values")
+            else:
+                present.append(col)
+        
+        if include_dtypes:
+            for col in present:
+                validation['dtype_info'][col] = self.detect_column_dtype(df[col])
+        
+        if include_missing and present:
+            # Missing shares for all selected columns in one pass over the frame
+            missing_pcts = df[present].isna().mean().mul(100).to_numpy()
+            for col, missing_pct in zip(present, missing_pcts):
+                if missing_pct > 50:
+                    validation['warnings'].append(f"Column '{col}' has {missing_pct:.1f}% missing values")
         
         if is_datetime:
-            date_related = ['year', 'month', 'day', 'hour', 'minute', 'second', 'date', 'time']
-            has_date_col = any(
-                any(dt in col.lower() for dt in date_related) 
-                for col in columns
-            )
+            has_date_col = any(_DATE_PART_NAME.search(col.lower()) for col in columns)
             if not has_date_col:
                 validation['warnings'].append(
                     "Selected columns don't appear to contain date/time components. "
@@ -823,6 +1194,18 @@ class DataTransformer:
         df: pd.DataFrame,
         column: str,
         separator: str
+    ) -> Dict[str, Any]:
+        return _cached_validation(
+            df,
+            ('split', column, separator),
+            lambda: self._validate_split_column(df, column, separator)
+        )
+    
+    def _validate_split_column(
+        self,
+        df: pd.DataFrame,
+        column: str,
+        separator: str
     ) -> Dict[str, Any]:
         validation = {
             'valid': True,
@@ -837,25 +1220,49 @@ class DataTransformer:
             validation['valid'] = False
             return validation
         
-        sample = df[column].dropna().head(10)
+        # The first ten non-null values usually sit near the top; only scan the whole
+        # column when the leading rows are too sparse
+        sample = df[column].head(SPLIT_PREVIEW_SCAN).dropna().head(10)
+        if len(sample) < 10 and len(df) > SPLIT_PREVIEW_SCAN:
+            sample = df[column].dropna().head(10)
         
         if separator:
-            split_counts = sample.astype(str).str.count(re.escape(separator)) + 1
-            validation['estimated_columns'] = int(split_counts.max()) if len(split_counts) > 0 else 0
+            # str.count on the literal separator matches the old escaped-regex count
+            # without building a pattern per call
+            sample_str = sample.astype(str)
+            split_counts = [value.count(separator) + 1 for value in sample_str]
+            # Ten counts at most: plain reductions, each computed once
+            min_parts = min(split_counts, default=0)
+            max_parts = max(split_counts, default=0)
+            validation['estimated_columns'] = max_parts
             
-            if split_counts.nunique() > 1:
+            if min_parts != max_parts:
                 validation['warnings'].append(
-                    f"Inconsistent split counts detected (range: {split_counts.min()} to {split_counts.max()} parts)"
+                    f"Inconsistent split counts detected (range: {min_parts} to {max_parts} parts)"
                 )
             
-            validation['preview'] = sample.astype(str).str.split(separator, expand=True).head(5).to_dict('records')
+            # Split only the rows shown; pattern-like separators split as regexes
+            # the way str.split would treat them
+            if _is_pattern_separator(separator):
+                pattern = re.compile(separator)
+                preview_parts = [pattern.split(value) for value in sample_str.head(5)]
+            else:
+                preview_parts = [value.split(separator) for value in sample_str.head(5)]
+            width = max((len(parts) for parts in preview_parts), default=0)
+            validation['preview'] = [
+                {i: parts[i] if i < len(parts) else None for i in range(width)}
+                for parts in preview_parts
+            ]
         else:
             validation['warnings'].append("No separator provided - will split on whitespace")
         
         return validation
     
-    def get_operation_history(self) -> List[Dict[str, Any]]:
-        return self.operation_history.copy()
+    def get_operation_history(self) -> Tuple[Dict[str, Any], ...]:
+        # Read-only snapshot; appending to it cannot reach the live history
+        return tuple(self.operation_history)
     
     def clear_history(self):
-        self.operation_history = []
+        # The validation cache is shared by every session; its LRU bound and
+        # weakref checks retire entries, so it is left alone here
+        self.operation_history.clear()
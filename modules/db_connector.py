@@ -6,74 +6,437 @@ Provides MySQL database connectivity for importing data
 import streamlit as st
 import pandas as pd
 from typing import List, Optional, Dict, Any
-from sqlalchemy import create_engine, text, inspect
-from sqlalchemy.exc import SQLAlchemyError
+import importlib.util
 import urllib.parse
+import time
+import io
+import os
+import functools
+from abc import ABC, abstractmethod
+import hashlib
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
+from modules.utils import optimize_dtypes
 
-class MySQLConnector:
-    """MySQL Database Connector for importing data into Renvo AI"""
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+    pa_csv = None
+
+# SQLAlchemy, the DB drivers and ConnectorX are imported on first use: most
+# sessions never open the database tabs, and these imports dominate startup.
+# Availability is checked without loading the package.
+CONNECTORX_AVAILABLE = importlib.util.find_spec("connectorx") is not None
+ADBC_POSTGRES_AVAILABLE = importlib.util.find_spec("adbc_driver_postgresql") is not None
+
+
+# Rows fetched per round-trip when streaming full imports
+IMPORT_CHUNK_SIZE = 50_000
+
+# Leading rows inspected when auto-detecting the column types of an import
+TYPE_DETECTION_SAMPLE_ROWS = 10_000
+
+# Seconds a fetched table list is reused before asking the server again
+TABLE_LIST_TTL = 30
+
+# Seconds schema, row-count and preview results are reused across reruns
+METADATA_CACHE_TTL = 60
+
+# Worker threads for overlapping independent metadata queries in the UI.
+# SQLAlchemy's pool hands each thread its own connection.
+DB_LOOKUP_WORKERS = 4
+_DB_EXECUTOR = ThreadPoolExecutor(max_workers=DB_LOOKUP_WORKERS, thread_name_prefix="renvo-db")
+
+# Rows buffered client-side per fetch from a server-side cursor
+STREAM_ROW_BUFFER = 10_000
+
+# Seconds to wait for a TCP connection before giving up on a dead host
+CONNECT_TIMEOUT = 5
+
+# Parallel range partitions for ConnectorX reads of tables with an integer key
+CONNECTORX_PARTITIONS = 8
+
+# Pixel height of the preview grid; a fixed height keeps it virtualized, so the
+# browser only renders the visible rows
+PREVIEW_GRID_HEIGHT = 400
+
+# Most rows a custom SELECT may import; the read stops at the cap (on MySQL via
+# sql_select_limit, since its unbuffered cursor drains the rest on close)
+CUSTOM_QUERY_ROW_CAP = 1_000_000
+
+# Seconds the import UI reuses schema, preview and row-count lookups; keyed on the
+# connection target, so they survive reconnecting to the same database
+UI_CACHE_TTL = 300
+
+# Parquet snapshots of imported tables (opt-in), reused until the table's version
+# token changes or the snapshot is older than TABLE_CACHE_TTL seconds. Per-user
+# and created owner-only, since the files hold table data
+TABLE_CACHE_TTL = 3600
+TABLE_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "renvo" / "sql_cache"
+
+
+def _read_sql_chunked(engine, query: str, chunksize: Optional[int] = IMPORT_CHUNK_SIZE,
+                      max_rows: Optional[int] = None,
+                      session_statements: Optional[tuple[str, str]] = None) -> pd.DataFrame:
+    """
+    Read a query result through a server-side cursor in chunks
+    
+    Streaming keeps only one chunk of raw DBAPI rows alive at a time instead of
+    materializing the whole result set as Python tuples before building the frame.
+    
+    Args:
+        engine: SQLAlchemy engine to read from
+        query: SQL query to execute
+        chunksize: Rows per chunk, or None to read in a single pass
+        max_rows: Stop reading once this many rows have arrived (requires chunksize)
+        session_statements: SQL run on the streaming connection before the read
+            and after it, e.g. to set and reset a server-side row limit
+        
+    Returns:
+        DataFrame with the query result, truncated to ``max_rows``
+    """
+    if not chunksize:
+        return pd.read_sql(query, engine)
+    
+    # Engines run in AUTOCOMMIT, but psycopg2 only opens named (server-side)
+    # cursors inside a transaction, so the streamed read gets its own
+    conn_options = dict(stream_results=True, max_row_buffer=STREAM_ROW_BUFFER,
+                        isolation_level="READ COMMITTED")
+    chunks = []
+    n_rows = 0
+    with engine.connect().execution_options(**conn_options) as conn:
+        if session_statements:
+            conn.exec_driver_sql(session_statements[0])
+        try:
+            reader = pd.read_sql(query, conn, chunksize=chunksize)
+            try:
+                for chunk in reader:
+                    chunks.append(chunk)
+                    n_rows += len(chunk)
+                    if max_rows is not None and n_rows >= max_rows:
+                        break
+            finally:
+                # Releases the cursor before the connection goes back to the pool
+                reader.close()
+        finally:
+            if session_statements:
+                conn.exec_driver_sql(session_statements[1])
+    
+    if not chunks:
+        return pd.DataFrame()
+    if len(chunks) == 1:
+        # Results under one chunk (most row-limited imports) skip the concat copy
+        df = chunks[0]
+    else:
+        df = pd.concat(chunks, ignore_index=True)
+    if max_rows is not None and len(df) > max_rows:
+        df = df.iloc[:max_rows]
+    return df
+
+
+def require_connection(empty_factory):
+    """
+    Guard a connector method so it returns ``(empty_factory(), "Not connected to database")``
+    instead of running when there is no live engine
+    
+    Args:
+        empty_factory: Callable producing the method's empty result (list, pd.DataFrame, int)
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not self.is_connected or self.engine is None:
+                return empty_factory(), "Not connected to database"
+            return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _encode_password(password: str) -> str:
+    """URL-encode a password for a connection string (plain alphanumerics pass through)"""
+    if password.isascii() and password.isalnum():
+        return password
+    return urllib.parse.quote_plus(password)
+
+
+def _config_digest(config: Dict[str, Any]) -> bytes:
+    """Digest of every connection parameter, so reuse checks need not keep the password"""
+    return hashlib.sha256(repr(sorted(config.items())).encode()).digest()
+
+
+def _memoize(cache: Dict[Any, tuple], key: Any, ttl: float, fetch):
+    """
+    Return a cached value younger than ``ttl`` seconds, or fetch and store a new one
+    
+    Streamlit reruns the whole script on every widget interaction, so connector
+    metadata lookups would otherwise hit the database several times per click.
+    Failed fetches raise and are not cached.
+    """
+    entry = cache.get(key)
+    now = time.monotonic()
+    if entry is not None and now - entry[0] <= ttl:
+        return entry[1]
+    value = fetch()
+    cache[key] = (now, value)
+    return value
+
+
+def _read_sql_connectorx(uri: Optional[str], query: str,
+                         partition_on: Optional[str] = None,
+                         arrow_dtypes: bool = False) -> Optional[pd.DataFrame]:
+    """
+    Read a query result with ConnectorX, straight from the wire protocol into Arrow
+    
+    Args:
+        uri: ConnectorX connection URI, or None when ConnectorX cannot be used
+        query: SQL query to execute
+        partition_on: Integer column to range-partition the read on
+        arrow_dtypes: Keep the Arrow buffers as ArrowDtype columns instead of
+            converting to numpy/object (display-only frames)
+        
+    Returns:
+        DataFrame, or None if ConnectorX is unavailable or the read failed
+        (callers then fall back to the SQLAlchemy path)
+    """
+    if not CONNECTORX_AVAILABLE or not uri:
+        return None
+    
+    try:
+        import connectorx as cx
+        
+        if arrow_dtypes:
+            table = cx.read_sql(uri, query, return_type="arrow")
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+        if partition_on:
+            return cx.read_sql(uri, query, return_type="pandas",
+                               partition_on=partition_on, partition_num=CONNECTORX_PARTITIONS)
+        return cx.read_sql(uri, query, return_type="pandas")
+    except Exception:
+        return None
+
+
+def _read_sql_adbc_postgres(uri: Optional[str], query: str) -> Optional[pd.DataFrame]:
+    """
+    Read a Postgres query result through the ADBC driver as Arrow record batches
+    
+    The driver transfers results with COPY in binary format and decodes them
+    straight into Arrow columns, with no text parsing or per-row Python objects.
+    
+    Returns:
+        DataFrame, or None if the driver is unavailable or the read failed
+    """
+    if not ADBC_POSTGRES_AVAILABLE or not uri:
+        return None
+    
+    try:
+        import adbc_driver_postgresql.dbapi
+        
+        with adbc_driver_postgresql.dbapi.connect(uri) as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query)
+                table = cursor.fetch_arrow_table()
+        return table.to_pandas()
+    except Exception:
+        return None
+
+
+def _write_table_cache(path: Path, df: pd.DataFrame):
+    """
+    Persist an imported table as a Parquet snapshot, replacing older versions
+    
+    Best effort: frames pyarrow cannot serialize (e.g. mixed-type object
+    columns) are simply not cached.
+    """
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # mkdir's mode is masked by the umask and ignored for existing directories
+        path.parent.chmod(0o700)
+        df.to_parquet(tmp_path, compression='zstd')
+        os.replace(tmp_path, path)
+        # Snapshots of the same import under an older table version are dead weight
+        prefix = path.name.split('-')[0]
+        for stale in path.parent.glob(f"{prefix}-*.parquet"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _integer_primary_key(inspector, table_name: str, schema: Optional[str] = None) -> Optional[str]:
+    """Return the table's single-column integer primary key, if it has one"""
+    try:
+        pk_cols = inspector.get_pk_constraint(table_name, schema=schema).get('constrained_columns', [])
+        if len(pk_cols) != 1:
+            return None
+        for column in inspector.get_columns(table_name, schema=schema):
+            if column['name'] == pk_cols[0]:
+                return pk_cols[0] if column['type'].python_type is int else None
+    except Exception:
+        return None
+    return None
+
+
+class BaseSQLConnector(ABC):
+    """
+    Shared plumbing for the SQL connectors
+    
+    Subclasses implement ``connect`` plus the dialect hooks: the connection string,
+    the table-list and describe queries, the row estimate and identifier quoting.
+    Everything else (metadata caching, previews, chunked and ConnectorX imports)
+    lives here so both databases get the same read path. The hooks are abstract,
+    so a connector missing one fails when it is instantiated.
+    """
+    
+    # SQLAlchemy dialect+driver and the matching ConnectorX URI scheme
+    dialect = ""
+    cx_scheme = ""
+    # Schema used for reflection lookups (None means the connection default)
+    schema: Optional[str] = None
+    # Appended to the table-list message, e.g. " in public schema"
+    table_scope = ""
     
     def __init__(self):
         self.engine = None
         self.connection_info = {}
         self.is_connected = False
+        self._cx_uri = None
+        self._inspector = None
+        self._metadata_cache = {}
+        self._config_digest = None
     
-    def connect(self, host: str, port: int, database: str, 
-                username: str, password: str, use_ssl: bool = False) -> tuple[bool, str]:
+    def _build_connection_string(self, scheme: str, username: str, encoded_password: str,
+                                 host: str, port: int, database: str) -> str:
+        """Build a database URL for the given scheme from already-encoded credentials"""
+        return f"{scheme}://{username}:{encoded_password}@{host}:{port}/{database}"
+    
+    def _create_engine(self, connection_string: str):
+        """Create the engine and open one connection to authenticate against the server"""
+        from sqlalchemy import create_engine
+        
+        engine = create_engine(
+            connection_string,
+            pool_pre_ping=True,  # Enable connection health checks
+            pool_recycle=3600,   # Recycle connections after 1 hour
+            # One pooled connection per background lookup worker plus the script
+            # thread, so overlapping metadata queries never open (and then close)
+            # overflow connections, each a fresh TCP/TLS handshake
+            pool_size=DB_LOOKUP_WORKERS + 1,
+            # Every query here is a read; skip the implicit BEGIN/COMMIT round-trips
+            isolation_level="AUTOCOMMIT",
+            connect_args={"connect_timeout": CONNECT_TIMEOUT},
+            echo=False           # Disable SQL logging
+        )
+        # The test connection is returned to the pool for the first real query
+        engine.connect().close()
+        return engine
+    
+    def is_connected_to(self, **config) -> bool:
         """
-        Establish connection to MySQL database
+        Whether there is a live engine opened with exactly this configuration
         
-        Args:
-            host: Database host address
-            port: Database port (default 3306)
-            database: Database name
-            username: Database username
-            password: Database password
-            use_ssl: Whether to use SSL connection
-            
-        Returns:
-            Tuple of (success: bool, message: str)
+        ``config`` must carry every connection parameter, credentials and SSL
+        settings included, so a changed password or SSL mode never reuses the
+        old connection.
+        """
+        return (self.is_connected and self.engine is not None
+                and self._config_digest == _config_digest(config))
+    
+    def _mark_connected(self, connection_info: Dict[str, Any], config: Dict[str, Any]):
+        """Record a successful connection and reset per-connection state"""
+        from sqlalchemy import inspect
+        
+        self.connection_info = connection_info
+        self._config_digest = _config_digest(config)
+        self.is_connected = True
+        self._inspector = inspect(self.engine)
+        self._metadata_cache = {}
+    
+    @abstractmethod
+    def _list_tables(self) -> List[str]:
+        """Return the table names visible to this connector"""
+    
+    @abstractmethod
+    def _describe_query(self, table_name: str):
+        """Return the query describing a table's columns"""
+    
+    @abstractmethod
+    def _row_estimate_query(self, table_name: str):
+        """Return a query yielding the server's row estimate as a ``count`` column"""
+    
+    @abstractmethod
+    def _quote_identifier(self, table_name: str) -> str:
+        """Quote a validated table name for interpolation into SQL"""
+    
+    @abstractmethod
+    def _quote_column(self, column_name: str) -> str:
+        """Quote a column name reported by the server for interpolation into SQL"""
+    
+    def _primary_key_order(self, table_name: str) -> str:
+        """Return an ``ORDER BY`` clause on the table's primary key, or "" if it has none"""
+        def fetch_order():
+            try:
+                pk_cols = self._inspector.get_pk_constraint(table_name, schema=self.schema)
+            except Exception:
+                return ""
+            columns = pk_cols.get('constrained_columns') or []
+            if not columns:
+                return ""
+            return " ORDER BY " + ", ".join(self._quote_column(c) for c in columns)
+        
+        return _memoize(self._metadata_cache, ('order_by', table_name), METADATA_CACHE_TTL, fetch_order)
+    
+    def _bulk_read(self, query: str) -> Optional[pd.DataFrame]:
+        """Dialect-specific fast path for full-table imports; None falls through"""
+        return None
+    
+    def _row_cap_statements(self, max_rows: int) -> Optional[tuple[str, str]]:
+        """
+        Statements that make the server stop a capped custom query at max_rows
+        
+        None when closing the streamed cursor early already ends the transfer,
+        as a Postgres named cursor does. Otherwise a (set, reset) pair run on the
+        streaming connection around the read.
+        """
+        return None
+    
+    @abstractmethod
+    def _table_version_query(self, table_name: str):
+        """Return a query whose single row usually changes when the table's data does"""
+    
+    def _table_cache_path(self, table_name: str, limit: Optional[int]) -> Optional[Path]:
+        """
+        Locate the Parquet snapshot for an import at the table's current version
+        
+        Returns None when snapshots cannot be used: pyarrow is missing or the
+        server reports no version for the table. The version token is a
+        heuristic, not a guarantee: Postgres statistics counters are flushed
+        late and can be reset, and MySQL's update_time has one-second
+        granularity, so a recent write may not change it. A snapshot can
+        therefore be stale; import_table bounds that with TABLE_CACHE_TTL and
+        says in its message when data came from a snapshot.
         """
+        if not PYARROW_AVAILABLE:
+            return None
         try:
-            # URL encode password to handle special characters
-            encoded_password = urllib.parse.quote_plus(password)
-            
-            # Build connection string
-            ssl_args = "?ssl_disabled=false" if use_ssl else ""
-            connection_string = f"mysql+pymysql://{username}:{encoded_password}@{host}:{port}/{database}{ssl_args}"
-            
-            # Create SQLAlchemy engine
-            self.engine = create_engine(
-                connection_string,
-                pool_pre_ping=True,  # Enable connection health checks
-                pool_recycle=3600,   # Recycle connections after 1 hour
-                echo=False           # Disable SQL logging
-            )
-            
-            # Test connection
-            with self.engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
-            
-            # Store connection info
-            self.connection_info = {
-                'host': host,
-                'port': port,
-                'database': database,
-                'username': username
-            }
-            self.is_connected = True
-            
-            return True, f"Successfully connected to {database}@{host}:{port}"
-            
-        except SQLAlchemyError as e:
-            error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
-            self.is_connected = False
-            return False, f"Connection failed: {error_msg}"
-        except Exception as e:
-            self.is_connected = False
-            return False, f"Connection failed: {str(e)}"
+            version = pd.read_sql(self._table_version_query(table_name), self.engine)
+        except Exception:
+            return None
+        if version.empty or version.iloc[0].isna().any():
+            return None
+        
+        info = self.connection_info
+        key = f"{info.get('host')}|{info.get('port')}|{info.get('database')}|{info.get('username')}|{table_name}|{limit}"
+        key_hash = hashlib.sha1(key.encode()).hexdigest()
+        version_hash = hashlib.sha1(repr(version.iloc[0].tolist()).encode()).hexdigest()[:16]
+        return TABLE_CACHE_DIR / f"{key_hash}-{version_hash}.parquet"
     
+    @require_connection(list)
     def get_tables(self) -> tuple[List[str], str]:
         """
         Get list of all tables in the connected database
@@ -81,16 +444,28 @@ class MySQLConnector:
         Returns:
             Tuple of (table_list: List[str], message: str)
         """
-        if not self.is_connected or not self.engine:
-            return [], "Not connected to database"
-        
         try:
-            inspector = inspect(self.engine)
-            tables = inspector.get_table_names()
-            return tables, f"Found {len(tables)} tables"
+            tables = _memoize(self._metadata_cache, ('tables',), TABLE_LIST_TTL, self._list_tables)
+            return tables, f"Found {len(tables)} tables{self.table_scope}"
         except Exception as e:
             return [], f"Failed to fetch tables: {str(e)}"
     
+    def _quote_table(self, table_name: str) -> str:
+        """
+        Validate a table name against the database's table list and quote it
+        
+        Identifiers cannot be bound as query parameters, so only names the server
+        reported are ever interpolated into SQL.
+        
+        Raises:
+            ValueError: If the table does not exist
+        """
+        tables, _ = self.get_tables()
+        if table_name not in tables:
+            raise ValueError(f"Unknown table '{table_name}'")
+        return self._quote_identifier(table_name)
+    
+    @require_connection(pd.DataFrame)
     def get_table_info(self, table_name: str) -> tuple[pd.DataFrame, str]:
         """
         Get table schema/structure information
@@ -101,98 +476,189 @@ class MySQLConnector:
         Returns:
             Tuple of (schema_df: DataFrame, message: str)
         """
-        if not self.is_connected or not self.engine:
-            return pd.DataFrame(), "Not connected to database"
-        
         try:
-            query = f"DESCRIBE `{table_name}`"
-            df = pd.read_sql(query, self.engine)
+            query = self._describe_query(table_name)
+            df = _memoize(self._metadata_cache, ('table_info', table_name), METADATA_CACHE_TTL,
+                          lambda: pd.read_sql(query, self.engine))
             return df, f"Schema for table '{table_name}'"
         except Exception as e:
             return pd.DataFrame(), f"Failed to get table info: {str(e)}"
     
-    def get_row_count(self, table_name: str) -> tuple[int, str]:
+    @require_connection(int)
+    def get_row_count(self, table_name: str, exact: bool = False) -> tuple[int, str]:
         """
-        Get the number of rows in a table
+        Get the approximate number of rows in a table
+        
+        Uses the server's statistics instead of a full COUNT(*) scan, which is
+        only run when explicitly requested.
         
         Args:
             table_name: Name of the table
+            exact: Run COUNT(*) instead of reading the estimate
             
         Returns:
-            Tuple of (count: int, message: str)
+            Tuple of (count: int, message: str); count is 0 when no estimate exists
         """
-        if not self.is_connected or not self.engine:
-            return 0, "Not connected to database"
-        
         try:
-            query = f"SELECT COUNT(*) as count FROM `{table_name}`"
-            df = pd.read_sql(query, self.engine)
-            count = int(df['count'].iloc[0])
+            count, estimated = _memoize(self._metadata_cache, ('row_count', table_name, exact), METADATA_CACHE_TTL,
+                                        lambda: self._count_rows(table_name, exact))
+            if count is None:
+                return 0, f"No row estimate for '{table_name}' yet (table not analyzed)"
+            if estimated:
+                return count, f"Table '{table_name}' has ~{count:,} rows (estimate)"
             return count, f"Table '{table_name}' has {count:,} rows"
         except Exception as e:
             return 0, f"Failed to count rows: {str(e)}"
     
-    def preview_table(self, table_name: str, limit: int = 100) -> tuple[pd.DataFrame, str]:
+    def _count_rows(self, table_name: str, exact: bool = False) -> tuple[Optional[int], bool]:
+        """Return (row count or None if there is no estimate, whether the count is an estimate)"""
+        if not exact:
+            df = pd.read_sql(self._row_estimate_query(table_name), self.engine)
+            if not df.empty and pd.notna(df['count'].iloc[0]) and df['count'].iloc[0] > 0:
+                return int(df['count'].iloc[0]), True
+            return None, True
+        
+        query = f"SELECT COUNT(*) as count FROM {self._quote_table(table_name)}"
+        df = pd.read_sql(query, self.engine)
+        return int(df['count'].iloc[0]), False
+    
+    @require_connection(pd.DataFrame)
+    def preview_table(self, table_name: str, limit: int = 100,
+                      offset: int = 0) -> tuple[pd.DataFrame, str]:
         """
         Preview table data with limited rows
         
         Args:
             table_name: Name of the table
             limit: Maximum number of rows to return
+            offset: Rows to skip, for paging through the table
             
         Returns:
             Tuple of (preview_df: DataFrame, message: str)
         """
-        if not self.is_connected or not self.engine:
-            return pd.DataFrame(), "Not connected to database"
+        from sqlalchemy import text
         
         try:
-            query = f"SELECT * FROM `{table_name}` LIMIT {limit}"
-            df = pd.read_sql(query, self.engine)
+            quoted = self._quote_table(table_name)
+            
+            def fetch_preview():
+                # Pages are only stable under a deterministic order
+                select = f"SELECT * FROM {quoted}{self._primary_key_order(table_name)}"
+                # Display-only rows stay Arrow-backed, so st.dataframe serializes
+                # them without another pandas -> Arrow conversion
+                df = _read_sql_connectorx(self._cx_uri, f"{select} LIMIT {int(limit)} OFFSET {int(offset)}",
+                                          arrow_dtypes=True)
+                if df is None:
+                    query = text(f"{select} LIMIT :lim OFFSET :off").bindparams(lim=int(limit), off=int(offset))
+                    df = pd.read_sql(query, self.engine)
+                return df
+            
+            df = _memoize(self._metadata_cache, ('preview', table_name, limit, offset), METADATA_CACHE_TTL,
+                          fetch_preview)
+            if offset:
+                return df, f"Showing rows {offset + 1:,}-{offset + len(df):,} from '{table_name}'"
             return df, f"Showing {len(df)} rows from '{table_name}'"
         except Exception as e:
             return pd.DataFrame(), f"Failed to preview table: {str(e)}"
     
-    def import_table(self, table_name: str, limit: Optional[int] = None) -> tuple[pd.DataFrame, str]:
+    @require_connection(pd.DataFrame)
+    def import_table(self, table_name: str, limit: Optional[int] = None,
+                     chunksize: Optional[int] = IMPORT_CHUNK_SIZE,
+                     optimize: bool = False,
+                     use_cache: bool = False) -> tuple[pd.DataFrame, str]:
         """
         Import entire table as DataFrame
         
         Args:
             table_name: Name of the table to import
             limit: Optional limit on number of rows
+            chunksize: Rows fetched per round-trip, or None to read in one pass
+            optimize: Compact dtypes (categories, downcast integers) after the fetch
+            use_cache: Reuse (and write) a local Parquet snapshot while the table is
+                unchanged; off by default since a snapshot is a copy of the table on disk
             
         Returns:
             Tuple of (data_df: DataFrame, message: str)
         """
-        if not self.is_connected or not self.engine:
-            return pd.DataFrame(), "Not connected to database"
-        
         try:
+            # Kept as a plain string for ConnectorX; the name is validated and the limit an int
             if limit:
-                query = f"SELECT * FROM `{table_name}` LIMIT {limit}"
+                query = f"SELECT * FROM {self._quote_table(table_name)} LIMIT {int(limit)}"
             else:
-                query = f"SELECT * FROM `{table_name}`"
+                query = f"SELECT * FROM {self._quote_table(table_name)}"
+            
+            cache_path = self._table_cache_path(table_name, limit) if use_cache else None
+            try:
+                cache_age = time.time() - cache_path.stat().st_mtime if cache_path else None
+            except OSError:
+                cache_age = None
+            if cache_age is not None and cache_age < TABLE_CACHE_TTL:
+                df = pd.read_parquet(cache_path)
+                if optimize:
+                    df = optimize_dtypes(df)
+                return df, (
+                    f"Loaded {len(df):,} rows and {len(df.columns)} columns from a local snapshot of "
+                    f"'{table_name}' taken {int(cache_age // 60)} min ago; recent changes to the table "
+                    f"may be missing (untick 'Cache imported tables locally' to read it live)"
+                )
             
-            df = pd.read_sql(query, self.engine)
+            # Partitioned reads split on key ranges, which a LIMIT would defeat
+            partition_on = None if limit else _integer_primary_key(self._inspector, table_name, schema=self.schema)
+            df = _read_sql_connectorx(self._cx_uri, query, partition_on)
+            if df is None:
+                df = self._bulk_read(query)
+            if df is None:
+                df = _read_sql_chunked(self.engine, query, chunksize)
+            if cache_path is not None:
+                _write_table_cache(cache_path, df)
+            if optimize:
+                df = optimize_dtypes(df)
             return df, f"Imported {len(df):,} rows and {len(df.columns)} columns from '{table_name}'"
         except Exception as e:
             return pd.DataFrame(), f"Failed to import table: {str(e)}"
     
-    def import_query(self, query: str) -> tuple[pd.DataFrame, str]:
+    @require_connection(pd.DataFrame)
+    def import_query(self, query: str,
+                     chunksize: Optional[int] = IMPORT_CHUNK_SIZE,
+                     optimize: bool = False,
+                     max_rows: Optional[int] = CUSTOM_QUERY_ROW_CAP) -> tuple[pd.DataFrame, str]:
         """
         Import data using custom SQL query
         
         Args:
             query: SQL query to execute
+            chunksize: Rows fetched per round-trip, or None to read in one pass
+            optimize: Compact dtypes (categories, downcast integers) after the fetch
+            max_rows: Most rows a SELECT may import, or None for no cap
             
         Returns:
             Tuple of (data_df: DataFrame, message: str)
         """
-        if not self.is_connected or not self.engine:
-            return pd.DataFrame(), "Not connected to database"
-        
         try:
-            df = pd.read_sql(query, self.engine)
+            # The query runs exactly as written. Wrapping it in a LIMITed derived
+            # table breaks trailing comments and semicolons, duplicate column names
+            # (MySQL error 1060) and the inner ORDER BY, so a capped SELECT is
+            # streamed and stops at the cap instead
+            stripped = query.strip()
+            first_word = stripped.split(None, 1)[0].upper() if stripped else ""
+            # Only SELECT/WITH can stream: Postgres runs a streamed read through a
+            # named (DECLARE) cursor, which SHOW and EXPLAIN reject
+            is_select = first_word in ('SELECT', 'WITH')
+            capped = bool(max_rows) and is_select
+            
+            if capped:
+                # ConnectorX always materializes the full result, so it is skipped here
+                df = _read_sql_chunked(self.engine, query, chunksize or IMPORT_CHUNK_SIZE,
+                                       max_rows=int(max_rows),
+                                       session_statements=self._row_cap_statements(int(max_rows)))
+            else:
+                df = _read_sql_connectorx(self._cx_uri, query)
+                if df is None:
+                    df = _read_sql_chunked(self.engine, query, chunksize if is_select else None)
+            if optimize:
+                df = optimize_dtypes(df)
+            if capped and len(df) >= max_rows:
+                return df, f"Query returned {len(df):,} rows (capped) and {len(df.columns)} columns"
             return df, f"Query returned {len(df):,} rows and {len(df.columns)} columns"
         except Exception as e:
             return pd.DataFrame(), f"Failed to execute query: {str(e)}"
@@ -203,24 +669,213 @@ class MySQLConnector:
     
     def disconnect(self):
         """Close database connection"""
-        if self.engine:
-            self.engine.dispose()
-            self.engine = None
+        # Reset state first, so the connector reads as disconnected even if
+        # closing the pool raises
+        engine, self.engine = self.engine, None
         self.is_connected = False
         self.connection_info = {}
+        self._cx_uri = None
+        self._inspector = None
+        self._metadata_cache = {}
+        self._config_digest = None
+        if engine is not None:
+            # Closes every pooled socket; connections a background lookup still
+            # has checked out are closed when returned instead of re-pooled
+            engine.dispose()
     
     def __del__(self):
         """Cleanup on deletion"""
         self.disconnect()
 
 
-class SupabaseConnector:
+class MySQLConnector(BaseSQLConnector):
+    """MySQL Database Connector for importing data into Renvo AI"""
+    
+    dialect = "mysql+pymysql"
+    cx_scheme = "mysql"
+    
+    def connect(self, host: str, port: int, database: str, 
+                username: str, password: str, use_ssl: bool = False) -> tuple[bool, str]:
+        """
+        Establish connection to MySQL database
+        
+        Args:
+            host: Database host address
+            port: Database port (default 3306)
+            database: Database name
+            username: Database username
+            password: Database password
+            use_ssl: Whether to use SSL connection
+            
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        # Already connected with this exact configuration: keep the warm engine and pool
+        target = {'host': host, 'port': port, 'database': database, 'username': username}
+        config = {**target, 'password': password, 'use_ssl': use_ssl}
+        if self.is_connected_to(**config):
+            return True, f"Already connected to {database}@{host}:{port}"
+        
+        from sqlalchemy.exc import SQLAlchemyError
+        
+        try:
+            # URL encode password to handle special characters
+            encoded_password = _encode_password(password)
+            
+            # Build connection string
+            ssl_args = "?ssl_disabled=false" if use_ssl else ""
+            connection_string = self._build_connection_string(
+                self.dialect, username, encoded_password, host, port, database
+            ) + ssl_args
+            
+            # ConnectorX has no equivalent of the PyMySQL SSL flag, so SSL
+            # connections always read through SQLAlchemy
+            self._cx_uri = None if use_ssl else self._build_connection_string(
+                self.cx_scheme, username, encoded_password, host, port, database
+            )
+            
+            self.engine = self._create_engine(connection_string)
+            self._mark_connected(target, config)
+            
+            return True, f"Successfully connected to {database}@{host}:{port}"
+            
+        except SQLAlchemyError as e:
+            error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
+            self.is_connected = False
+            return False, f"Connection failed: {error_msg}"
+        except Exception as e:
+            self.is_connected = False
+            return False, f"Connection failed: {str(e)}"
+    
+    def _list_tables(self) -> List[str]:
+        # The inspector memoizes reflection results, so drop them first
+        self._inspector.clear_cache()
+        return self._inspector.get_table_names()
+    
+    def _describe_query(self, table_name: str):
+        return f"DESCRIBE {self._quote_table(table_name)}"
+    
+    def _row_estimate_query(self, table_name: str):
+        from sqlalchemy import text
+        
+        # The storage engine's estimate, kept in information_schema
+        return text("""
+            SELECT table_rows AS count
+            FROM information_schema.tables
+            WHERE table_schema = DATABASE() AND table_name = :t
+        """).bindparams(t=table_name)
+    
+    def _quote_identifier(self, table_name: str) -> str:
+        return self._quote_column(table_name)
+    
+    def _quote_column(self, column_name: str) -> str:
+        return "`" + column_name.replace("`", "``") + "`"
+    
+    def _row_cap_statements(self, max_rows: int) -> Optional[tuple[str, str]]:
+        # Closing a pymysql unbuffered cursor reads and discards every remaining
+        # row, so the cap has to stop the result on the server. sql_select_limit
+        # applies to the top-level SELECT only, and an explicit LIMIT still wins
+        return (f"SET SESSION sql_select_limit = {int(max_rows)}",
+                "SET SESSION sql_select_limit = DEFAULT")
+    
+    def _table_version_query(self, table_name: str):
+        from sqlalchemy import text
+        
+        # update_time is NULL for engines that do not track it (and for InnoDB
+        # after a restart). MySQL 8 also serves it from cached statistics unless
+        # information_schema_stats_expiry is 0, so any other setting yields no row;
+        # on servers without that variable (5.7) the query fails. Either way the
+        # snapshot is skipped. update_time has one-second granularity, so a write
+        # in the same second as the snapshot goes unseen; TABLE_CACHE_TTL bounds that
+        return text("""
+            SELECT update_time AS version
+            FROM information_schema.tables
+            WHERE table_schema = DATABASE() AND table_name = :t
+              AND @@session.information_schema_stats_expiry = 0
+        """).bindparams(t=table_name)
+
+
+class SupabaseConnector(BaseSQLConnector):
     """Supabase Database Connector for importing data into Renvo AI"""
     
-    def __init__(self):
-        self.engine = None
-        self.connection_info = {}
-        self.is_connected = False
+    dialect = "postgresql+psycopg2"
+    cx_scheme = "postgresql"
+    schema = "public"
+    table_scope = " in public schema"
+    
+    # Read the catalogs directly: information_schema.columns is a view joining
+    # a dozen catalogs with per-row privilege checks to build ~40 columns
+    _DESCRIBE_SQL = """
+        SELECT 
+            a.attname AS "Column",
+            format_type(a.atttypid, a.atttypmod) AS "Type",
+            CASE WHEN a.attnotnull THEN 'NO' ELSE 'YES' END AS "Nullable",
+            pg_get_expr(d.adbin, d.adrelid) AS "Default"
+        FROM pg_attribute a
+        LEFT JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+        WHERE a.attrelid = to_regclass(:qualified)
+        AND a.attnum > 0 AND NOT a.attisdropped
+        ORDER BY a.attnum
+    """
+    
+    # Planner statistics; -1 or 0 for tables that were never analyzed
+    _ROW_ESTIMATE_SQL = """
+        SELECT reltuples::bigint AS count
+        FROM pg_class
+        WHERE relname = :t AND relnamespace = 'public'::regnamespace
+    """
+    
+    @staticmethod
+    def resolve_target(project_url: str, custom_host: Optional[str] = None,
+                       custom_port: int = 5432, custom_user: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Work out the project reference, host, port, database and user for a connection
+        
+        Returns:
+            Dict with project_ref, host, port, database and username
+        """
+        # 1. Robustly extract the 20-character Project Reference
+        clean_url = project_url.strip()
+        if '://' in clean_url:
+            clean_url = clean_url.split('://')[1]
+        if clean_url.endswith('/'):
+            clean_url = clean_url[:-1]
+        
+        if '.supabase.' in clean_url:
+            parts = clean_url.split('.')
+            project_ref = parts[1] if parts[0] == 'db' else parts[0]
+        else:
+            project_ref = clean_url
+
+        # 2. Determine Host, Port, and User
+        if not custom_host:
+            if '.pooler.' in clean_url or clean_url.endswith('.supabase.com'):
+                host = clean_url
+                port = 6543
+            else:
+                host = f"db.{project_ref}.supabase.co"
+                port = 5432
+        else:
+            host = custom_host
+            port = custom_port
+        
+        # 3. Connection Details
+        if custom_user:
+            username = custom_user
+        elif port == 6543:
+            username = f"postgres.{project_ref}"
+        else:
+            username = "postgres"
+        
+        return {'project_ref': project_ref, 'host': host, 'port': port,
+                'database': "postgres", 'username': username}
+    
+    def _build_connection_string(self, scheme: str, username: str, encoded_password: str,
+                                 host: str, port: int, database: str) -> str:
+        # Supabase only accepts TLS connections
+        return super()._build_connection_string(
+            scheme, username, encoded_password, host, port, database
+        ) + "?sslmode=require"
     
     def connect(self, project_url: str, db_password: str, 
                 custom_host: Optional[str] = None, 
@@ -229,67 +884,38 @@ class SupabaseConnector:
         """
         Establish connection to Supabase PostgreSQL database
         """
+        from sqlalchemy.exc import SQLAlchemyError
+        
         try:
-            # 1. Robustly extract the 20-character Project Reference
-            clean_url = project_url.strip()
-            if '://' in clean_url:
-                clean_url = clean_url.split('://')[1]
-            if clean_url.endswith('/'):
-                clean_url = clean_url[:-1]
-            
-            if '.supabase.' in clean_url:
-                parts = clean_url.split('.')
-                project_ref = parts[1] if parts[0] == 'db' else parts[0]
-            else:
-                project_ref = clean_url
-
-            # 2. Determine Host, Port, and User
-            if not custom_host:
-                if '.pooler.' in clean_url or clean_url.endswith('.supabase.com'):
-                    host = clean_url
-                    port = 6543
-                else:
-                    host = f"db.{project_ref}.supabase.co"
-                    port = 5432
-            else:
-                host = custom_host
-                port = custom_port
-            
-            # 3. Connection Details
-            database = "postgres"
-            if custom_user:
-                username = custom_user
-            elif port == 6543:
-                username = f"postgres.{project_ref}"
-            else:
-                username = "postgres"
+            target = self.resolve_target(project_url, custom_host, custom_port, custom_user)
+            project_ref = target['project_ref']
+            host, port = target['host'], target['port']
+            database, username = target['database'], target['username']
+            config = {**target, 'password': db_password}
+            
+            # Already connected with this exact configuration: keep the warm engine and pool
+            if self.is_connected_to(**config):
+                return True, f"Already connected to Supabase project: {project_ref}"
             
             # URL encode password to handle special characters
-            encoded_password = urllib.parse.quote_plus(db_password)
+            encoded_password = _encode_password(db_password)
             
             # Build PostgreSQL connection string
-            connection_string = f"postgresql+psycopg2://{username}:{encoded_password}@{host}:{port}/{database}?sslmode=require"
-            
-            # Create SQLAlchemy engine
-            self.engine = create_engine(
-                connection_string,
-                pool_pre_ping=True,
-                pool_recycle=3600,
-                echo=False
+            connection_string = self._build_connection_string(
+                self.dialect, username, encoded_password, host, port, database
+            )
+            self._cx_uri = self._build_connection_string(
+                self.cx_scheme, username, encoded_password, host, port, database
             )
             
-            # Test connection
-            with self.engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
-            
-            # Store connection info
-            self.connection_info = {
+            self.engine = self._create_engine(connection_string)
+            self._mark_connected({
                 'project_ref': project_ref,
                 'host': host,
                 'port': port,
-                'database': database
-            }
-            self.is_connected = True
+                'database': database,
+                'username': username
+            }, config)
             
             return True, f"Successfully connected to Supabase project: {project_ref}"
             
@@ -307,15 +933,17 @@ class SupabaseConnector:
                     # However, some projects use the same host but different port. 
                     # We'll first try the same host with 6543 which is often supported.
                     pooler_port = 6543
-                    pooler_conn_string = f"postgresql+psycopg2://{username}:{encoded_password}@{host}:{pooler_port}/{database}?sslmode=require"
+                    pooler_conn_string = self._build_connection_string(
+                        self.dialect, username, encoded_password, host, pooler_port, database
+                    )
                     
-                    self.engine = create_engine(pooler_conn_string, pool_pre_ping=True, pool_recycle=3600, echo=False)
+                    self.engine = self._create_engine(pooler_conn_string)
                     
-                    with self.engine.connect() as conn:
-                        conn.execute(text("SELECT 1"))
-                    
-                    self.connection_info = {'project_ref': project_ref, 'host': host, 'port': pooler_port, 'database': database}
-                    self.is_connected = True
+                    self._cx_uri = self._build_connection_string(
+                        self.cx_scheme, username, encoded_password, host, pooler_port, database
+                    )
+                    self._mark_connected({'project_ref': project_ref, 'host': host, 'port': pooler_port,
+                                          'database': database, 'username': username}, config)
                     return True, f"Successfully connected to Supabase project: {project_ref} (via Connection Pooler)"
                 except Exception:
                     # If auto-retry fails, proceed to detailed error message below
@@ -336,115 +964,217 @@ class SupabaseConnector:
             self.is_connected = False
             return False, f"Connection failed: {str(e)}"
     
-    def get_tables(self) -> tuple[List[str], str]:
-        """Get list of all tables in the public schema"""
-        if not self.is_connected or not self.engine:
-            return [], "Not connected to database"
+    def _list_tables(self) -> List[str]:
+        # Get tables from public schema (default Supabase schema)
+        query = """
+            SELECT table_name 
+            FROM information_schema.tables 
+            WHERE table_schema = 'public' 
+            AND table_type = 'BASE TABLE'
+            ORDER BY table_name
+        """
+        return pd.read_sql(query, self.engine)['table_name'].tolist()
+    
+    def _describe_query(self, table_name: str):
+        from sqlalchemy import text
         
-        try:
-            # Get tables from public schema (default Supabase schema)
-            query = """
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                AND table_type = 'BASE TABLE'
-                ORDER BY table_name
-            """
-            df = pd.read_sql(query, self.engine)
-            tables = df['table_name'].tolist()
-            return tables, f"Found {len(tables)} tables in public schema"
-        except Exception as e:
-            return [], f"Failed to fetch tables: {str(e)}"
+        return text(self._DESCRIBE_SQL).bindparams(qualified=self._quote_table(table_name))
     
-    def get_table_info(self, table_name: str) -> tuple[pd.DataFrame, str]:
-        """Get table schema/structure information"""
-        if not self.is_connected or not self.engine:
-            return pd.DataFrame(), "Not connected to database"
+    def _row_estimate_query(self, table_name: str):
+        from sqlalchemy import text
         
-        try:
-            query = f"""
-                SELECT 
-                    column_name as "Column",
-                    data_type as "Type",
-                    is_nullable as "Nullable",
-                    column_default as "Default"
-                FROM information_schema.columns 
-                WHERE table_schema = 'public' 
-                AND table_name = '{table_name}'
-                ORDER BY ordinal_position
-            """
-            df = pd.read_sql(query, self.engine)
-            return df, f"Schema for table '{table_name}'"
-        except Exception as e:
-            return pd.DataFrame(), f"Failed to get table info: {str(e)}"
+        return text(self._ROW_ESTIMATE_SQL).bindparams(t=table_name)
     
-    def get_row_count(self, table_name: str) -> tuple[int, str]:
-        """Get the number of rows in a table"""
-        if not self.is_connected or not self.engine:
-            return 0, "Not connected to database"
+    def bootstrap_table(self, table_name: str) -> bool:
+        """
+        Fetch a table's row estimate and schema in one round trip
         
+        Both results are stored in the connector's metadata cache, so the
+        get_row_count and get_table_info calls that follow a table selection
+        are served locally.
+        
+        Returns:
+            True if the cache was seeded, False if the lookup failed (the
+            regular per-query paths then run as usual)
+        """
+        from sqlalchemy import text
+        
+        if not self.is_connected or self.engine is None:
+            return False
         try:
-            query = f'SELECT COUNT(*) as count FROM public."{table_name}"'
-            df = pd.read_sql(query, self.engine)
-            count = int(df['count'].iloc[0])
-            return count, f"Table '{table_name}' has {count:,} rows"
-        except Exception as e:
-            return 0, f"Failed to count rows: {str(e)}"
+            query = text(f"""
+                WITH c AS ({self._ROW_ESTIMATE_SQL}),
+                     s AS ({self._DESCRIBE_SQL})
+                SELECT
+                    (SELECT count FROM c) AS count,
+                    (SELECT json_agg(s) FROM s) AS schema
+            """).bindparams(t=table_name, qualified=self._quote_table(table_name))
+            with self.engine.connect() as conn:
+                count, schema = conn.execute(query).one()
+        except Exception:
+            return False
+        
+        now = time.monotonic()
+        estimate = int(count) if count is not None and count > 0 else None
+        self._metadata_cache[('row_count', table_name, False)] = (now, (estimate, True))
+        self._metadata_cache[('table_info', table_name)] = (
+            now, pd.DataFrame(schema or [], columns=["Column", "Type", "Nullable", "Default"])
+        )
+        return True
     
-    def preview_table(self, table_name: str, limit: int = 100) -> tuple[pd.DataFrame, str]:
-        """Preview table data with limited rows"""
-        if not self.is_connected or not self.engine:
-            return pd.DataFrame(), "Not connected to database"
+    def _quote_identifier(self, table_name: str) -> str:
+        # Schema-qualified, so the search_path cannot redirect the read
+        return 'public.' + self._quote_column(table_name)
+    
+    def _quote_column(self, column_name: str) -> str:
+        return '"' + column_name.replace('"', '""') + '"'
+    
+    def _table_version_query(self, table_name: str):
+        from sqlalchemy import text
         
-        try:
-            query = f'SELECT * FROM public."{table_name}" LIMIT {limit}'
-            df = pd.read_sql(query, self.engine)
-            return df, f"Showing {len(df)} rows from '{table_name}'"
-        except Exception as e:
-            return pd.DataFrame(), f"Failed to preview table: {str(e)}"
+        # Postgres keeps no modification time, but the cumulative write counters
+        # move on inserts, updates, deletes and truncates. They are only flushed
+        # by backends periodically and are reset by pg_stat_reset() or crash
+        # recovery, so this is a best-effort token; TABLE_CACHE_TTL bounds staleness
+        return text("""
+            SELECT n_tup_ins, n_tup_upd, n_tup_del, n_live_tup
+            FROM pg_stat_user_tables
+            WHERE schemaname = 'public' AND relname = :t
+        """).bindparams(t=table_name)
     
-    def import_table(self, table_name: str, limit: Optional[int] = None) -> tuple[pd.DataFrame, str]:
-        """Import entire table as DataFrame"""
-        if not self.is_connected or not self.engine:
-            return pd.DataFrame(), "Not connected to database"
+    # Result column types the CSV export can carry without changing them, by
+    # type OID: bool, int8/int2/int4, float4/float8, and the text types
+    # (text, varchar, bpchar, name). Anything else makes _bulk_read fall through
+    # to the regular read, which decodes dates, numerics and bytea itself.
+    _CSV_ARROW_TYPES = {
+        16: 'bool_',
+        20: 'int64', 21: 'int64', 23: 'int64',
+        700: 'float64', 701: 'float64',
+        25: 'string', 1043: 'string', 1042: 'string', 19: 'string',
+    }
+    
+    def _bulk_read(self, query: str) -> Optional[pd.DataFrame]:
+        """
+        Export a SELECT through COPY ... TO STDOUT and parse it with pyarrow's CSV reader
         
+        COPY skips the per-row protocol messages of a regular result set, and the
+        multi-threaded Arrow parser builds columns directly instead of Python tuples.
+        The ADBC driver, when installed, does the same over binary COPY and is
+        tried first. Every column is parsed as the type the server reports for it,
+        never inferred from the text. Returns None when pyarrow is unavailable, a
+        result column has a type the CSV round trip would alter, or the COPY fails.
+        """
+        df = _read_sql_adbc_postgres(self._cx_uri, query)
+        if df is not None:
+            return df
+        
+        if not PYARROW_AVAILABLE:
+            return None
+        
+        raw = self.engine.raw_connection()
         try:
-            if limit:
-                query = f'SELECT * FROM public."{table_name}" LIMIT {limit}'
-            else:
-                query = f'SELECT * FROM public."{table_name}"'
+            with raw.cursor() as cursor:
+                cursor.execute(f"SELECT * FROM ({query}) AS q LIMIT 0")
+                columns = [(col.name, col.type_code) for col in cursor.description]
+            if len({name for name, _ in columns}) != len(columns):
+                return None
+            column_types = {}
+            for name, type_oid in columns:
+                arrow_type = self._CSV_ARROW_TYPES.get(type_oid)
+                if arrow_type is None:
+                    return None
+                column_types[name] = getattr(pa, arrow_type)()
             
-            df = pd.read_sql(query, self.engine)
-            return df, f"Imported {len(df):,} rows and {len(df.columns)} columns from '{table_name}'"
-        except Exception as e:
-            return pd.DataFrame(), f"Failed to import table: {str(e)}"
+            buffer = io.BytesIO()
+            with raw.cursor() as cursor:
+                cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT CSV, HEADER TRUE)", buffer)
+            buffer.seek(0)
+            table = pa_csv.read_csv(
+                buffer,
+                convert_options=pa_csv.ConvertOptions(
+                    column_types=column_types,
+                    # Postgres writes booleans as t/f, NULL as an unquoted empty
+                    # field and an empty string as ""; only boolean columns use t/f
+                    true_values=['t'], false_values=['f'],
+                    null_values=[''], strings_can_be_null=True,
+                    quoted_strings_can_be_null=False
+                )
+            )
+            return table.to_pandas()
+        except Exception:
+            return None
+        finally:
+            raw.close()
+
+
+class _LookupFailed(Exception):
+    """Carries a failed connector result out of a cached lookup so it is not cached"""
     
-    def import_query(self, query: str) -> tuple[pd.DataFrame, str]:
-        """Import data using custom SQL query"""
-        if not self.is_connected or not self.engine:
-            return pd.DataFrame(), "Not connected to database"
-        
+    def __init__(self, result: tuple):
+        super().__init__(result[1])
+        self.result = result
+
+
+def _raise_if_failed(result: tuple) -> tuple:
+    """Pass a successful connector result through; raise _LookupFailed otherwise"""
+    if result[1].startswith(("Failed", "Not connected")):
+        raise _LookupFailed(result)
+    return result
+
+
+def _connection_key(connector) -> tuple:
+    """Hashable identity of a connector's target, used to key the UI lookup caches"""
+    return (type(connector).__name__,) + tuple(sorted(connector.get_connection_info().items()))
+
+
+@st.cache_data(ttl=UI_CACHE_TTL, show_spinner=False)
+def _cached_schema(_connector, conn_key: tuple, table_name: str) -> tuple[pd.DataFrame, str]:
+    """Schema lookup shared across reruns and reconnects to the same target"""
+    return _raise_if_failed(_connector.get_table_info(table_name))
+
+
+@st.cache_data(ttl=UI_CACHE_TTL, show_spinner=False)
+def _cached_preview(_connector, conn_key: tuple, table_name: str, limit: int,
+                    offset: int = 0) -> tuple[pd.DataFrame, str]:
+    """Preview page lookup shared across reruns and reconnects to the same target"""
+    return _raise_if_failed(_connector.preview_table(table_name, limit, offset))
+
+
+@st.cache_data(ttl=UI_CACHE_TTL, show_spinner=False)
+def _cached_row_count(_connector, conn_key: tuple, table_name: str) -> tuple[int, str]:
+    """Row-count lookup shared across reruns and reconnects to the same target"""
+    return _raise_if_failed(_connector.get_row_count(table_name))
+
+
+def _cached_lookup(lookup, *args) -> tuple:
+    """Call a cached lookup, returning failures as a normal (empty, message) result"""
+    try:
+        return lookup(*args)
+    except _LookupFailed as e:
+        return e.result
+
+
+def _bootstrap_table_lookups(connector: SupabaseConnector, conn_key: tuple,
+                             table_name: str) -> tuple[int, str]:
+    """Seed the schema and row-count caches from one composite query; returns the count result"""
+    connector.bootstrap_table(table_name)
+    _cached_lookup(_cached_schema, connector, conn_key, table_name)
+    return _cached_lookup(_cached_row_count, connector, conn_key, table_name)
+
+
+def _show_frame(df: pd.DataFrame):
+    """Render a display-only frame as a fixed-height Arrow table (no index, no Styler)"""
+    if PYARROW_AVAILABLE:
         try:
-            df = pd.read_sql(query, self.engine)
-            return df, f"Query returned {len(df):,} rows and {len(df.columns)} columns"
-        except Exception as e:
-            return pd.DataFrame(), f"Failed to execute query: {str(e)}"
-    
-    def get_connection_info(self) -> Dict[str, Any]:
-        """Get current connection information (without password)"""
-        return self.connection_info.copy()
-    
-    def disconnect(self):
-        """Close database connection"""
-        if self.engine:
-            self.engine.dispose()
-            self.engine = None
-        self.is_connected = False
-        self.connection_info = {}
-    
-    def __del__(self):
-        """Cleanup on deletion"""
-        self.disconnect()
+            data = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Mixed-type object columns (Decimal next to None, JSON, bytes, ...)
+            # cannot be typed up front; st.dataframe coerces those itself
+            data = None
+        if data is not None:
+            st.dataframe(data, height=PREVIEW_GRID_HEIGHT, use_container_width=True)
+            return
+    st.dataframe(df, height=PREVIEW_GRID_HEIGHT, use_container_width=True, hide_index=True)
 
 
 def render_database_connector_ui():
@@ -505,7 +1235,16 @@ def render_database_connector_ui():
             return None
         
         with st.spinner("Connecting to database..."):
-            connector = MySQLConnector()
+            # Resubmitting the same configuration reuses the live connector (connect()
+            # fast path); anything else gets a fresh one, so a failed attempt leaves
+            # the current connection in place
+            existing = st.session_state.get('db_connector')
+            if existing is not None and existing.is_connected_to(
+                    host=host, port=port, database=database, username=username,
+                    password=password, use_ssl=use_ssl):
+                connector = existing
+            else:
+                connector = MySQLConnector()
             success, message = connector.connect(host, port, database, username, password, use_ssl)
             
             if success:
@@ -541,10 +1280,12 @@ def render_database_connector_ui():
             col1, col2 = st.columns([2, 1])
             
             with col1:
-                row_count, count_msg = connector.get_row_count(selected_table)
-                st.info(f"📊 {count_msg}")
+                # Filled once the count finishes; it runs alongside the preview query
+                count_slot = st.empty()
+            count_future = _DB_EXECUTOR.submit(connector.get_row_count, selected_table)
             
             with col2:
+                exact_count = st.button("🔢 Exact Count", help="Run COUNT(*) instead of using the estimate")
                 if st.button("📖 View Schema"):
                     schema_df, schema_msg = connector.get_table_info(selected_table)
                     if not schema_df.empty:
@@ -558,6 +1299,12 @@ def render_database_connector_ui():
                     st.dataframe(preview_df, use_container_width=True)
                     st.caption(preview_msg)
             
+            row_count, count_msg = count_future.result()
+            if exact_count:
+                # A full scan, so only on request
+                row_count, count_msg = connector.get_row_count(selected_table, exact=True)
+            count_slot.info(f"📊 {count_msg}")
+            
             # Import options
             st.subheader("📥 Import Options")
             
@@ -584,28 +1331,53 @@ def render_database_connector_ui():
             elif import_method == "Custom SQL Query":
                 custom_query = st.text_area(
                     "SQL Query",
-                    value=f"SELECT * FROM `{selected_table}` LIMIT 1000",
+                    value=f"SELECT * FROM {connector._quote_identifier(selected_table)} LIMIT 1000",
                     height=100,
                     help="Write a custom SQL query to import specific data"
                 )
                 st.caption("⚠️ Use caution with custom queries. Ensure proper syntax and avoid destructive operations.")
             
+            auto_optimize = st.checkbox(
+                "Auto-optimize memory",
+                value=False,
+                help="Store low-cardinality text columns as categories and downcast integers",
+                key="mysql_auto_optimize"
+            )
+            
+            use_table_cache = st.checkbox(
+                "Cache imported tables locally",
+                value=False,
+                help="Keep a private Parquet copy of table imports on this machine and reuse it for up to an hour "
+                     "while the table appears unchanged; very recent writes may not be picked up",
+                key="mysql_table_cache"
+            )
+            
             # Import button
             if st.button("📥 Import Data", type="primary", use_container_width=True):
                 with st.spinner("Importing data..."):
                     
                     if import_method == "Custom SQL Query" and custom_query:
-                        df, msg = connector.import_query(custom_query)
+                        df, msg = connector.import_query(custom_query, optimize=auto_optimize)
                     else:
-                        df, msg = connector.import_table(selected_table, row_limit)
+                        df, msg = connector.import_table(selected_table, row_limit, optimize=auto_optimize,
+                                                         use_cache=use_table_cache)
                     
                     if not df.empty:
-                        # Store in session state
-                        st.session_state.dataset = df.copy()
-                        st.session_state.original_dataset = df.copy()
+                        # Store in session state; copy-on-write (set globally when
+                        # modules.utils is imported) keeps the two aliases independent
+                        st.session_state.dataset = df
+                        st.session_state.original_dataset = df
                         
-                        # Auto-detect column types
-                        st.session_state.column_types = detect_column_types(df)
+                        # Auto-detect column types; inference settles well within the sample.
+                        # Re-importing a table with the same columns and dtypes keeps the
+                        # types already in place (including any the user adjusted)
+                        signature = (tuple(df.columns), tuple(map(str, df.dtypes)))
+                        if (st.session_state.get('_import_column_signature') != signature
+                                or list(st.session_state.get('column_types', {})) != list(df.columns)):
+                            st.session_state.column_types = detect_column_types(
+                                df.head(TYPE_DETECTION_SAMPLE_ROWS)
+                            )
+                            st.session_state._import_column_signature = signature
                         
                         # Clear previous analysis
                         st.session_state.column_analysis = {}
@@ -628,8 +1400,10 @@ def render_database_connector_ui():
         # Disconnect button
         st.divider()
         if st.button("🔌 Disconnect from Database"):
+            # Drop the session's reference first, so a failing close cannot leave
+            # a half-closed connector behind
+            st.session_state.pop('db_connector', None)
             connector.disconnect()
-            del st.session_state.db_connector
             st.success("Disconnected from database")
             st.rerun()
     
@@ -736,7 +1510,18 @@ def render_supabase_connector_ui():
             return None
         
         with st.spinner("Connecting to Supabase..."):
-            connector = SupabaseConnector()
+            # Resubmitting the same configuration reuses the live connector and its pool
+            # (connect() fast path); anything else gets a fresh one, so a failed
+            # attempt leaves the current connection in place
+            if use_advanced:
+                target = SupabaseConnector.resolve_target(project_url, adv_host, adv_port, adv_user)
+            else:
+                target = SupabaseConnector.resolve_target(project_url)
+            existing = st.session_state.get('supabase_connector')
+            if existing is not None and existing.is_connected_to(**target, password=db_password):
+                connector = existing
+            else:
+                connector = SupabaseConnector()
             
             if use_advanced:
                 success, message = connector.connect(
@@ -759,6 +1544,7 @@ def render_supabase_connector_ui():
     # If connected, show table selection
     if 'supabase_connector' in st.session_state and st.session_state.supabase_connector.is_connected:
         connector = st.session_state.supabase_connector
+        conn_key = _connection_key(connector)
         
         st.divider()
         st.subheader("📋 Select Data to Import")
@@ -784,22 +1570,48 @@ def render_supabase_connector_ui():
             col1, col2 = st.columns([2, 1])
             
             with col1:
-                row_count, count_msg = connector.get_row_count(selected_table)
-                st.info(f"📊 {count_msg}")
+                # Filled once the count finishes; it runs alongside the preview query
+                count_slot = st.empty()
+            # On a newly selected table, fetch the count and schema together in one
+            # round trip and warm both caches, so "View Schema" is a cache hit
+            if st.session_state.get('_supabase_prefetched_table') != (conn_key, selected_table):
+                st.session_state._supabase_prefetched_table = (conn_key, selected_table)
+                count_future = _DB_EXECUTOR.submit(_bootstrap_table_lookups, connector, conn_key, selected_table)
+            else:
+                count_future = _DB_EXECUTOR.submit(_cached_lookup, _cached_row_count,
+                                                   connector, conn_key, selected_table)
             
             with col2:
+                exact_count = st.button("🔢 Exact Count", key="supabase_exact_count_btn",
+                                        help="Run COUNT(*) instead of using the estimate")
                 if st.button("📖 View Schema", key="supabase_schema_btn"):
-                    schema_df, schema_msg = connector.get_table_info(selected_table)
+                    schema_df, schema_msg = _cached_lookup(_cached_schema, connector, conn_key, selected_table)
                     if not schema_df.empty:
-                        st.dataframe(schema_df, use_container_width=True)
+                        _show_frame(schema_df)
             
             # Preview table
             with st.expander("👁️ Preview Table Data", expanded=False):
-                preview_rows = st.slider("Rows to preview", 10, 100, 50, key="supabase_preview_slider")
-                preview_df, preview_msg = connector.preview_table(selected_table, preview_rows)
-                if not preview_df.empty:
-                    st.dataframe(preview_df, use_container_width=True)
-                    st.caption(preview_msg)
+                # Expander bodies run even when collapsed, so only query on request
+                if st.checkbox("Load preview", key=f"supabase_load_preview_{selected_table}"):
+                    # A form holds back reruns while the controls are adjusted, so only the
+                    # submitted page size and page are ever fetched
+                    with st.form(f"supabase_preview_form_{selected_table}", border=False):
+                        page_col, size_col = st.columns([1, 2])
+                        with size_col:
+                            preview_rows = st.slider("Rows per page", 10, 100, 50, key="supabase_preview_slider")
+                        with page_col:
+                            page = st.number_input("Page", min_value=1, value=1, step=1,
+                                                   key=f"supabase_preview_page_{selected_table}")
+                        st.form_submit_button("🔄 Refresh Preview")
+                    # Only one page is ever fetched, whatever the table size
+                    offset = (int(page) - 1) * preview_rows
+                    preview_df, preview_msg = _cached_lookup(_cached_preview, connector, conn_key,
+                                                             selected_table, preview_rows, offset)
+                    if not preview_df.empty:
+                        _show_frame(preview_df)
+                        st.caption(preview_msg)
+                    elif offset:
+                        st.caption("No rows on this page")
             
             # Import options
             st.subheader("📥 Import Options")
@@ -820,7 +1632,7 @@ def render_supabase_connector_ui():
                     "Maximum Rows to Import",
                     min_value=100,
                     max_value=1000000,
-                    value=min(10000, row_count) if row_count > 0 else 10000,
+                    value=10000,
                     step=1000,
                     help="Limit the number of rows to import for large tables",
                     key="supabase_row_limit"
@@ -829,29 +1641,65 @@ def render_supabase_connector_ui():
             elif import_method == "Custom SQL Query":
                 custom_query = st.text_area(
                     "SQL Query",
-                    value=f'SELECT * FROM public."{selected_table}" LIMIT 1000',
+                    value=f"SELECT * FROM {connector._quote_identifier(selected_table)} LIMIT 1000",
                     height=100,
                     help="Write a custom SQL query to import specific data",
                     key="supabase_custom_query"
                 )
                 st.caption("⚠️ Use PostgreSQL syntax. Tables are in the 'public' schema by default.")
             
+            auto_optimize = st.checkbox(
+                "Auto-optimize memory",
+                value=False,
+                help="Store low-cardinality text columns as categories and downcast integers",
+                key="supabase_auto_optimize"
+            )
+            
+            use_table_cache = st.checkbox(
+                "Cache imported tables locally",
+                value=False,
+                help="Keep a private Parquet copy of table imports on this machine and reuse it for up to an hour "
+                     "while the table appears unchanged; very recent writes may not be picked up",
+                key="supabase_table_cache"
+            )
+            
             # Import button
-            if st.button("📥 Import Data", type="primary", use_container_width=True, key="supabase_import_btn"):
+            import_clicked = st.button("📥 Import Data", type="primary", use_container_width=True,
+                                       key="supabase_import_btn")
+            
+            # Nothing above depends on the count, so the options render before waiting on it
+            if exact_count:
+                # A full scan, so only on request
+                _, count_msg = connector.get_row_count(selected_table, exact=True)
+            else:
+                _, count_msg = count_future.result()
+            count_slot.info(f"📊 {count_msg}")
+            
+            if import_clicked:
                 with st.spinner("Importing data from Supabase..."):
                     
                     if import_method == "Custom SQL Query" and custom_query:
-                        df, msg = connector.import_query(custom_query)
+                        df, msg = connector.import_query(custom_query, optimize=auto_optimize)
                     else:
-                        df, msg = connector.import_table(selected_table, row_limit)
+                        df, msg = connector.import_table(selected_table, row_limit, optimize=auto_optimize,
+                                                         use_cache=use_table_cache)
                     
                     if not df.empty:
-                        # Store in session state
-                        st.session_state.dataset = df.copy()
-                        st.session_state.original_dataset = df.copy()
+                        # Store in session state; copy-on-write (set globally when
+                        # modules.utils is imported) keeps the two aliases independent
+                        st.session_state.dataset = df
+                        st.session_state.original_dataset = df
                         
-                        # Auto-detect column types
-                        st.session_state.column_types = detect_column_types(df)
+                        # Auto-detect column types; inference settles well within the sample.
+                        # Re-importing a table with the same columns and dtypes keeps the
+                        # types already in place (including any the user adjusted)
+                        signature = (tuple(df.columns), tuple(map(str, df.dtypes)))
+                        if (st.session_state.get('_import_column_signature') != signature
+                                or list(st.session_state.get('column_types', {})) != list(df.columns)):
+                            st.session_state.column_types = detect_column_types(
+                                df.head(TYPE_DETECTION_SAMPLE_ROWS)
+                            )
+                            st.session_state._import_column_signature = signature
                         
                         # Clear previous analysis
                         st.session_state.column_analysis = {}
@@ -877,8 +1725,10 @@ def render_supabase_connector_ui():
         # Disconnect button
         st.divider()
         if st.button("🔌 Disconnect from Supabase", key="supabase_disconnect_btn"):
+            # Drop the session's reference first, so a failing close cannot leave
+            # a half-closed connector behind
+            st.session_state.pop('supabase_connector', None)
             connector.disconnect()
-            del st.session_state.supabase_connector
             st.success("Disconnected from Supabase")
             st.rerun()
     
@@ -174,85 +174,68 @@ class Breakpoints:
 # BUTTON STYLES
 # ============================================================================
 
+# Padding and font size per button size, shared by every ButtonStyle variant
+_BUTTON_SIZES = {
+    "sm": {"padding": "8px 16px", "font_size": 14},
+    "md": {"padding": "12px 24px", "font_size": 16},
+    "lg": {"padding": "16px 32px", "font_size": 18},
+}
+
+
 class ButtonStyle:
     """Button styling configurations"""
     
     @staticmethod
     def primary(size: Literal["sm", "md", "lg"] = "md") -> dict:
         """Primary button style"""
-        sizes = {
-            "sm": {"padding": "8px 16px", "font_size": 14},
-            "md": {"padding": "12px 24px", "font_size": 16},
-            "lg": {"padding": "16px 32px", "font_size": 18},
-        }
         return {
             "background_color": Colors.PRIMARY,
             "text_color": Colors.TEXT_INVERSE,
             "border_color": Colors.PRIMARY,
             "border_radius": BorderRadius.MD,
             "font_weight": Typography.WEIGHT_SEMIBOLD,
-            **sizes.get(size, sizes["md"])
+            **_BUTTON_SIZES.get(size, _BUTTON_SIZES["md"])
         }
     
     @staticmethod
     def secondary(size: Literal["sm", "md", "lg"] = "md") -> dict:
         """Secondary button style"""
-        sizes = {
-            "sm": {"padding": "8px 16px", "font_size": 14},
-            "md": {"padding": "12px 24px", "font_size": 16},
-            "lg": {"padding": "16px 32px", "font_size": 18},
-        }
         return {
             "background_color": Colors.SECONDARY_LIGHT,
             "text_color": Colors.SECONDARY_DARK,
             "border_color": Colors.SECONDARY,
             "border_radius": BorderRadius.MD,
             "font_weight": Typography.WEIGHT_SEMIBOLD,
-            **sizes.get(size, sizes["md"])
+            **_BUTTON_SIZES.get(size, _BUTTON_SIZES["md"])
         }
     
     @staticmethod
     def success(size: Literal["sm", "md", "lg"] = "md") -> dict:
         """Success button style"""
-        sizes = {
-            "sm": {"padding": "8px 16px", "font_size": 14},
-            "md": {"padding": "12px 24px", "font_size": 16},
-            "lg": {"padding": "16px 32px", "font_size": 18},
-        }
         return {
             "background_color": Colors.SUCCESS,
             "text_color": Colors.TEXT_INVERSE,
             "border_color": Colors.SUCCESS,
             "border_radius": BorderRadius.MD,
             "font_weight": Typography.WEIGHT_SEMIBOLD,
-            **sizes.get(size, sizes["md"])
+            **_BUTTON_SIZES.get(size, _BUTTON_SIZES["md"])
         }
     
     @staticmethod
     def danger(size: Literal["sm", "md", "lg"] = "md") -> dict:
         """Danger button style"""
-        sizes = {
-            "sm": {"padding": "8px 16px", "font_size": 14},
-            "md": {"padding": "12px 24px", "font_size": 16},
-            "lg": {"padding": "16px 32px", "font_size": 18},
-        }
         return {
             "background_color": Colors.ERROR,
             "text_color": Colors.TEXT_INVERSE,
             "border_color": Colors.ERROR,
             "border_radius": BorderRadius.MD,
             "font_weight": Typography.WEIGHT_SEMIBOLD,
-            **sizes.get(size, sizes["md"])
+            **_BUTTON_SIZES.get(size, _BUTTON_SIZES["md"])
         }
     
     @staticmethod
     def outline(size: Literal["sm", "md", "lg"] = "md") -> dict:
         """Outline button style"""
-        sizes = {
-            "sm": {"padding": "8px 16px", "font_size": 14},
-            "md": {"padding": "12px 24px", "font_size": 16},
-            "lg": {"padding": "16px 32px", "font_size": 18},
-        }
         return {
             "background_color": Colors.BACKGROUND,
             "text_color": Colors.PRIMARY,
@@ -260,7 +243,7 @@ class ButtonStyle:
             "border_width": 2,
             "border_radius": BorderRadius.MD,
             "font_weight": Typography.WEIGHT_SEMIBOLD,
-            **sizes.get(size, sizes["md"])
+            **_BUTTON_SIZES.get(size, _BUTTON_SIZES["md"])
         }
 
 
@@ -268,9 +251,9 @@ class ButtonStyle:
 # GLOBAL STYLING
 # ============================================================================
 
-def apply_global_styles():
-    """Apply consistent global CSS styling across the application"""
-    css = f"""
+# Built once at import: the tokens above are constants, and apply_global_styles
+# runs on every rerun of every page
+_GLOBAL_CSS = f"""
     <style>
     /* ========== ROOT & BASE STYLES ========== */
     :root {{
@@ -929,4 +912,8 @@ def apply_global_styles():
     }}
     </style>
     """
-    st.markdown(css, unsafe_allow_html=True)
+
+
+def apply_global_styles():
+    """Apply consistent global CSS styling across the application"""
+    st.markdown(_GLOBAL_CSS, unsafe_allow_html=True)
@@ -3,8 +3,79 @@ Reusable UI Components with consistent styling
 Provides helper functions for common UI patterns
 """
 
+import contextlib
+import html
+import inspect
 import streamlit as st
-from modules.design_system import Colors, Spacing, Typography, BorderRadius, Shadows
+from modules.design_system import Colors
+
+# st.fragment (1.37+) or its experimental predecessor (1.33+); None on older Streamlit
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+# Keyed containers (Streamlit 1.42+) keep a stable identity across reruns
+_CONTAINER_TAKES_KEY = "key" in inspect.signature(st.container).parameters
+
+# styled_info_box box_type -> Streamlit alert; anything else renders as info
+_INFO_BOXES = {
+    "success": st.success,
+    "warning": st.warning,
+    "error": st.error,
+    "info": st.info,
+}
+
+
+def _with_icon(icon: str, text: str, prefix: str = "") -> str:
+    """Label text with its optional leading icon (and markdown prefix such as '## ')"""
+    return f"{prefix}{icon} {text}" if icon else f"{prefix}{text}"
+
+
+# Session key holding the active card/section id path used by scoped_key()
+_KEY_SCOPE = "_card_stack"
+
+
+@contextlib.contextmanager
+def _key_scope(path):
+    """Make ``path`` the active key scope for the duration of the block"""
+    if path is None:
+        yield
+        return
+    previous = st.session_state.get(_KEY_SCOPE, ())
+    st.session_state[_KEY_SCOPE] = path
+    try:
+        yield
+    finally:
+        st.session_state[_KEY_SCOPE] = previous
+
+
+def _child_scope(card_id: str):
+    """Key scope path for a card/section nested in the current one, or None without an id"""
+    if not card_id:
+        return None
+    return tuple(st.session_state.get(_KEY_SCOPE, ())) + (card_id,)
+
+
+def scoped_key(name: str) -> str:
+    """
+    Widget key namespaced by the enclosing styled_card/styled_section ids
+    
+    Use inside content_fn, e.g. ``st.text_input("Name", key=scoped_key("name"))``,
+    so the same content rendered in two cards does not collide and keeps its
+    state when sibling cards appear or disappear.
+    """
+    return "/".join(tuple(st.session_state.get(_KEY_SCOPE, ())) + (name,))
+
+
+def _render_content(content_fn, fragment: bool, scope=None):
+    """Call content_fn, as a fragment when requested so its widgets rerun only it"""
+    def run():
+        # Re-entered on fragment reruns, which skip the enclosing card's code
+        with _key_scope(scope):
+            content_fn()
+    
+    if fragment and _fragment is not None:
+        _fragment(run)()
+    else:
+        run()
 
 
 def styled_button(
@@ -39,41 +110,37 @@ def styled_button(
     Returns:
         Boolean indicating if button was clicked
     """
-    full_label = f"{icon} {label}" if icon else label
-    
-    col_config = None
-    if full_width:
-        col_config = [1]
-    
-    cols = st.columns(col_config or [1, 10]) if not full_width else [st.columns(1)[0]]
-    
-    if full_width:
-        with cols[0]:
-            clicked = st.button(
-                full_label,
-                key=key,
-                on_click=on_click,
-                args=args if args else (),
-                kwargs=kwargs if kwargs else {},
-                disabled=disabled,
-                help=help_text,
-                use_container_width=True
-            )
-    else:
-        clicked = st.button(
-            full_label,
-            key=key,
-            on_click=on_click,
-            args=args if args else (),
-            kwargs=kwargs if kwargs else {},
-            disabled=disabled,
-            help=help_text,
-            use_container_width=True
-        )
+    full_label = _with_icon(icon, label)
+    
+    # use_container_width already gives the full-width layout; no wrapper columns
+    # Only send help when there is some; None still adds a field to the element
+    extra = {"help": help_text} if help_text else {}
+    clicked = st.button(
+        full_label,
+        key=key,
+        on_click=on_click,
+        args=args or (),
+        kwargs=kwargs or {},
+        disabled=disabled,
+        use_container_width=True,
+        **extra
+    )
     
     return clicked
 
 
+_METRIC_CSS = """
+        <style>
+        [data-testid="stMetricValue"] {
+            font-size: clamp(1rem, 5vw, 2.5rem);
+            white-space: nowrap;
+            overflow: hidden;
+            text-overflow: ellipsis;
+        }
+        </style>
+        """
+
+
 def styled_metric(
     label: str,
     value,
@@ -84,19 +151,7 @@ def styled_metric(
     """
     Create a styled metric card with responsive font size
     """
-    st.markdown(
-        """
-        <style>
-        [data-testid="stMetricValue"] {
-            font-size: clamp(1rem, 5vw, 2.5rem);
-            white-space: nowrap;
-            overflow: hidden;
-            text-overflow: ellipsis;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_METRIC_CSS, unsafe_allow_html=True)
     st.metric(label, value, delta=delta, help=help_text)
 
 
@@ -118,14 +173,13 @@ def styled_header(
     Returns:
         None (displays header)
     """
-    header_text = f"{icon} {title}" if icon else title
-    st.markdown(f"## {header_text}")
-    
+    # One markdown element for heading, subtitle and rule instead of up to three
+    parts = [_with_icon(icon, title, prefix="## ")]
     if subtitle:
-        st.markdown(f"_{subtitle}_")
-    
+        parts.append(f"_{subtitle}_")
     if divider:
-        st.divider()
+        parts.append("---")
+    st.markdown("\n\n".join(parts))
 
 
 def styled_section(
@@ -133,7 +187,10 @@ def styled_section(
     content_fn,
     icon: str = None,
     expanded: bool = True,
-    help_text: str = None
+    help_text: str = None,
+    fragment: bool = False,
+    card_id: str = None,
+    lazy: bool = False
 ):
     """
     Create a styled expandable section
@@ -144,14 +201,29 @@ def styled_section(
         icon: Icon emoji/character
         expanded: Whether section starts expanded
         help_text: Help tooltip
+        fragment: Run content_fn as a fragment, so interacting with its widgets
+            reruns only the section instead of the whole page
+        card_id: Namespace for scoped_key() calls made inside content_fn
+        lazy: With expanded=False, show a toggle instead of a collapsed expander and
+            only call content_fn once it is switched on (a collapsed expander still
+            runs its content on every rerun)
     
     Returns:
         None (displays section)
     """
-    section_title = f"{icon} {title}" if icon else title
-    
-    with st.expander(section_title, expanded=expanded, help=help_text):
-        content_fn()
+    section_title = _with_icon(icon, title)
+    
+    if lazy and not expanded:
+        if not st.toggle(section_title, key=f"_section_open_{card_id or title}"):
+            return
+        expanded = True
+    
+    # st.expander has no help tooltip in the supported Streamlit range, so passing
+    # help= raised; show it as a caption at the top of the section instead
+    with st.expander(section_title, expanded=expanded):
+        if help_text:
+            st.caption(help_text)
+        _render_content(content_fn, fragment, _child_scope(card_id))
 
 
 def styled_info_box(
@@ -172,22 +244,8 @@ def styled_info_box(
     Returns:
         None (displays box)
     """
-    full_content = ""
-    if title:
-        full_content += f"**{icon} {title}**\n\n"
-    else:
-        full_content += f"{icon} "
-    
-    full_content += content
-    
-    if box_type == "success":
-        st.success(full_content)
-    elif box_type == "warning":
-        st.warning(full_content)
-    elif box_type == "error":
-        st.error(full_content)
-    else:  # info
-        st.info(full_content)
+    full_content = f"**{icon} {title}**\n\n{content}" if title else f"{icon} {content}"
+    _INFO_BOXES.get(box_type, st.info)(full_content)
 
 
 def styled_columns_layout(
@@ -204,10 +262,8 @@ def styled_columns_layout(
     Returns:
         List of column containers
     """
-    gap_values = {"sm": 1, "md": 2, "lg": 3}
-    gap_ratio = gap_values.get(gap, 2)
-    
-    return st.columns([1] * num_columns)
+    # An int spec gives equal-width columns, same as [1] * num_columns
+    return st.columns(num_columns)
 
 
 def styled_form_group(
@@ -229,10 +285,15 @@ def styled_form_group(
         Result from input function
     """
     required_text = " *" if required else ""
-    st.markdown(f"**{label}{required_text}**")
-    
     if help_text:
-        st.caption(help_text)
+        # Label and helper text in one element rather than markdown + caption
+        st.markdown(
+            f"**{label}{required_text}**  \n"
+            f"<span style='color:{Colors.TEXT_SECONDARY};font-size:0.85em'>{html.escape(help_text)}</span>",
+            unsafe_allow_html=True
+        )
+    else:
+        st.markdown(f"**{label}{required_text}**")
     
     return input_fn()
 
@@ -242,7 +303,10 @@ def styled_card(
     content_fn=None,
     footer_fn=None,
     icon: str = None,
-    style: str = "default"
+    style: str = "default",
+    fragment: bool = False,
+    content_key: str = None,
+    card_id: str = None
 ):
     """
     Create a styled card container
@@ -253,27 +317,39 @@ def styled_card(
         footer_fn: Function to render card footer
         icon: Icon emoji
         style: "default", "highlighted", "subtle"
+        fragment: Run content_fn as a fragment, so interacting with its widgets
+            reruns only the card body instead of the whole page
+        content_key: Stable key for the card container, so its widgets keep their
+            identity when cards are added or reordered (ignored before Streamlit 1.42)
+        card_id: Namespace for scoped_key() calls made inside content_fn/footer_fn
     
     Returns:
         None (displays card)
     """
+    if content_fn is not None and not callable(content_fn):
+        raise TypeError("content_fn must be callable")
+    
     # Use Streamlit container to create card
-    with st.container():
+    container_kwargs = {"key": content_key} if content_key and _CONTAINER_TAKES_KEY else {}
+    scope = _child_scope(card_id)
+    with st.container(**container_kwargs):
         if title:
-            title_text = f"{icon} {title}" if icon else title
+            title_text = _with_icon(icon, title)
             st.markdown(f"**{title_text}**")
         
         if content_fn:
-            content_fn()
+            _render_content(content_fn, fragment, scope)
         
         if footer_fn:
             st.divider()
-            footer_fn()
+            with _key_scope(scope):
+                footer_fn()
 
 
 def styled_data_summary(
     data_dict: dict,
-    columns: int = 4
+    columns: int = 4,
+    use_html: bool = False
 ):
     """
     Create a styled summary of data metrics
@@ -281,15 +357,43 @@ def styled_data_summary(
     Args:
         data_dict: Dictionary of label: value pairs
         columns: Number of columns for layout
+        use_html: Render every metric in one HTML grid element instead of one
+            st.metric per item (no delta or help support)
     
     Returns:
         None (displays summary)
     """
+    if use_html:
+        cells = "".join(
+            f'<div><div style="font-size:0.8em;color:{Colors.TEXT_SECONDARY}">'
+            f'{html.escape(str(label))}</div>'
+            '<div style="font-size:1.5em;font-weight:600">'
+            f'{html.escape(str(value))}</div></div>'
+            for label, value in data_dict.items()
+        )
+        st.markdown(
+            f'<div style="display:grid;grid-template-columns:repeat({int(columns)},1fr);gap:1rem">'
+            f'{cells}</div>',
+            unsafe_allow_html=True
+        )
+        return
+    
     cols = st.columns(columns)
+    items = list(data_dict.items())
     
-    for idx, (label, value) in enumerate(data_dict.items()):
-        with cols[idx % columns]:
-            st.metric(label, value)
+    # Same round-robin placement, but each column is entered once
+    for i, col in enumerate(cols):
+        with col:
+            for label, value in items[i::columns]:
+                st.metric(label, value)
+
+
+# Horizontal rule per styled_divider spacing
+_DIVIDERS = {
+    "sm": '<hr style="margin:0.25rem 0">',
+    "md": '<hr style="margin:0.75rem 0">',
+    "lg": '<hr style="margin:1.5rem 0">',
+}
 
 
 def styled_divider(spacing: str = "md"):
@@ -302,7 +406,7 @@ def styled_divider(spacing: str = "md"):
     Returns:
         None (displays divider)
     """
-    st.divider()
+    st.markdown(_DIVIDERS.get(spacing, _DIVIDERS["md"]), unsafe_allow_html=True)
 
 
 def get_responsive_columns(total_columns: int = 4, breakpoint: str = "md") -> int:
@@ -1,10 +1,22 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 import json
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Lets the working dataset, the original and the undo/redo snapshots share column
+# buffers until one of them is modified. Set at import so every page (including
+# ones opened directly) runs with it before touching session data.
+pd.set_option("mode.copy_on_write", True)
+
 def initialize_session_state():
     """Initialize all session state variables"""
     if 'dataset' not in st.session_state:
@@ -47,33 +59,38 @@ def initialize_session_state():
 def detect_column_types(df: pd.DataFrame) -> Dict[str, str]:
     """Enhanced column type detection beyond basic pandas dtypes"""
     column_types = {}
+    # Non-null counts for every column in one vectorized pass; columns are then
+    # addressed by position, which never materializes a dropna() copy
+    non_null_counts = df.count().to_numpy()
     
-    for col in df.columns:
-        series = df[col].dropna()
+    for i, (col, dtype) in enumerate(df.dtypes.items()):
+        non_null = non_null_counts[i]
         
-        if len(series) == 0:
+        if non_null == 0:
             column_types[col] = 'empty'
             continue
-            
+        
+        series = df.iloc[:, i]
+        
         # Check for binary columns
-        unique_vals = series.unique()
-        if len(unique_vals) == 2:
+        n_unique = series.nunique()
+        if n_unique == 2:
             column_types[col] = 'binary'
             continue
             
         # Check for categorical with low cardinality
-        if series.dtype == 'object':
-            if len(unique_vals) / len(series) < 0.1 and len(unique_vals) < 20:
+        if dtype == 'object' or isinstance(dtype, pd.CategoricalDtype):
+            if n_unique / non_null < 0.1 and n_unique < 20:
                 column_types[col] = 'categorical'
             else:
                 column_types[col] = 'text'
             continue
             
         # Numeric types
-        if pd.api.types.is_numeric_dtype(series):
+        if pd.api.types.is_numeric_dtype(dtype):
             # Check if it's actually ordinal (integers with reasonable range)
-            if pd.api.types.is_integer_dtype(series):
-                if len(unique_vals) < 10 and series.min() >= 0:
+            if pd.api.types.is_integer_dtype(dtype):
+                if n_unique < 10 and series.min() >= 0:
                     column_types[col] = 'ordinal'
                 else:
                     column_types[col] = 'integer'
@@ -82,7 +99,7 @@ def detect_column_types(df: pd.DataFrame) -> Dict[str, str]:
             continue
             
         # Date/time
-        if pd.api.types.is_datetime64_any_dtype(series):
+        if pd.api.types.is_datetime64_any_dtype(dtype):
             column_types[col] = 'datetime'
             continue
             
@@ -90,6 +107,34 @@ def detect_column_types(df: pd.DataFrame) -> Dict[str, str]:
     
     return column_types
 
+def optimize_dtypes(df: pd.DataFrame, max_unique_ratio: float = 0.5) -> pd.DataFrame:
+    """Shrink a freshly loaded frame: low-cardinality strings become categories
+    and integer columns are downcast to the smallest integer type that fits.
+
+    Float columns are left as float64: float32 reductions accumulate in float32
+    and would shift means and sums even when every value round-trips exactly.
+    """
+    n_rows = len(df)
+    if n_rows == 0:
+        return df
+
+    converted = {}
+    for col in df.columns:
+        series = df[col]
+        if series.dtype == 'object':
+            if series.nunique(dropna=False) / n_rows < max_unique_ratio:
+                converted[col] = series.astype('category')
+        elif pd.api.types.is_integer_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            converted[col] = pd.to_numeric(series, downcast='integer')
+
+    if not converted:
+        return df
+    # Item assignment, not assign(**converted): labels need not be strings
+    out = df.copy(deep=False)
+    for col, series in converted.items():
+        out[col] = series
+    return out
+
 def calculate_basic_stats(df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
     """Calculate basic statistics for each column"""
     stats = {}
@@ -134,10 +179,15 @@ def save_cleaning_operation(operation: Dict[str, Any]):
     st.session_state.cleaning_history[column].append(operation)
 
 def create_backup():
-    """Create a backup of current dataset state for undo functionality"""
+    """
+    Create a backup of current dataset state for undo functionality
+    
+    Snapshots are copy-on-write shallow copies: they only hold their own copy
+    of the columns an operation later changes, not the whole frame.
+    """
     if st.session_state.dataset is not None:
         backup = {
-            'dataset': st.session_state.dataset.copy(),
+            'dataset': st.session_state.dataset.copy(deep=False),
             'column_analysis': st.session_state.column_analysis.copy(),
             'timestamp': datetime.now().isoformat()
         }
@@ -155,7 +205,7 @@ def undo_last_operation():
     if st.session_state.undo_stack:
         # Move current state to redo stack
         current_state = {
-            'dataset': st.session_state.dataset.copy(),
+            'dataset': st.session_state.dataset.copy(deep=False),
             'column_analysis': st.session_state.column_analysis.copy(),
             'timestamp': datetime.now().isoformat()
         }
@@ -174,7 +224,7 @@ def redo_last_operation():
     if st.session_state.redo_stack:
         # Move current state to undo stack
         current_state = {
-            'dataset': st.session_state.dataset.copy(),
+            'dataset': st.session_state.dataset.copy(deep=False),
             'column_analysis': st.session_state.column_analysis.copy(),
             'timestamp': datetime.now().isoformat()
         }
@@ -195,12 +245,17 @@ def export_configuration() -> str:
         'cleaning_history': st.session_state.get('cleaning_history', {}),
         'timestamp': datetime.now().isoformat()
     }
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            config,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode('utf-8')
     return json.dumps(config, indent=2)
 
-def import_configuration(config_json: str) -> bool:
-    """Import configuration from JSON"""
+def import_configuration(config_json: Union[str, bytes]) -> bool:
+    """Import configuration from JSON text or raw UTF-8 bytes"""
     try:
-        config = json.loads(config_json)
+        config = orjson.loads(config_json) if ORJSON_AVAILABLE else json.loads(config_json)
         st.session_state.column_types = config.get('column_types', {})
         st.session_state.cleaning_history = config.get('cleaning_history', {})
         return True
@@ -1,9 +1,40 @@
+import reprlib
+import weakref
 import streamlit as st
 import pandas as pd
 import numpy as np
 from modules.utils import initialize_session_state, create_backup
 from modules.data_transformer import DataTransformer
 
+
+def _first_non_null(series, k):
+    """Return up to k non-null values, scanning only as far as needed"""
+    values = []
+    for val in series:
+        if pd.api.types.is_scalar(val) and pd.isna(val):
+            continue
+        values.append(val)
+        if len(values) == k:
+            break
+    return values
+
+
+# Bounded formatter for sample blobs: nested containers are elided while
+# formatting instead of building the full text and slicing it afterwards
+_SAMPLE_REPR = reprlib.Repr()
+_SAMPLE_REPR.maxlevel = 4
+_SAMPLE_REPR.maxdict = 20
+_SAMPLE_REPR.maxlist = 20
+_SAMPLE_REPR.maxstring = 200
+_SAMPLE_REPR.maxother = 200
+
+
+def _sample_text(val, limit=500):
+    """Format a sample value for display, capped at limit characters"""
+    text = val if isinstance(val, str) else _SAMPLE_REPR.repr(val)
+    return text[:limit] + ('...' if len(text) > limit else '')
+
+
 initialize_session_state()
 
 st.title("Data Transformation")
@@ -13,8 +44,11 @@ if st.session_state.dataset is None:
     st.stop()
 
 df = st.session_state.dataset
+available_columns = df.columns.tolist()
 transformer = DataTransformer()
 
+_as_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda fn: fn)
+
 st.markdown("""
 Transform your data by merging or splitting columns, and handle nested JSON/dictionary data.
 All operations support various data types including dates, times, and complex structures.
@@ -25,7 +59,9 @@ transformation_tabs = st.tabs([
     "Expand JSON Data"
 ])
 
-with transformation_tabs[0]:
+# Each tab runs as a fragment so widget changes inside it only rerun that tab,
+# not the status panel below; apply handlers still call st.rerun() for a full refresh
+def _merge_split_tab():
     st.header("Merge / Split Columns")
     
     operation_mode = st.toggle("Split Mode", value=False, help="Toggle between Merge and Split operations")
@@ -34,7 +70,6 @@ with transformation_tabs[0]:
         st.subheader("Merge Columns")
         st.markdown("Combine multiple columns into a single column with custom separators.")
         
-        available_columns = df.columns.tolist()
         merge_columns = st.multiselect(
             "Select columns to merge",
             options=available_columns,
@@ -101,7 +136,10 @@ with transformation_tabs[0]:
                         help="Use strftime format codes (e.g., %Y-%m-%d)"
                     )
             
-            validation = transformer.validate_merge_columns(df, merge_columns, is_datetime_merge)
+            # The merge tab only shows warnings and errors, not the detected dtypes
+            validation = transformer.validate_merge_columns(
+                df, merge_columns, is_datetime_merge, include_dtypes=False
+            )
             
             if validation['warnings']:
                 for warning in validation['warnings']:
@@ -112,14 +150,11 @@ with transformation_tabs[0]:
                     st.error(error)
             
             st.markdown("#### Preview")
-            preview_df = df[merge_columns].head(5).copy()
-            st.dataframe(preview_df, use_container_width=True)
+            st.dataframe(df.iloc[:5][merge_columns], use_container_width=True)
             
             col1, col2 = st.columns([1, 1])
             with col1:
                 if st.button("Apply Merge", type="primary", disabled=not validation['valid']):
-                    create_backup()
-                    
                     result_df, operation_info = transformer.merge_columns(
                         df=df,
                         columns=merge_columns,
@@ -131,6 +166,7 @@ with transformation_tabs[0]:
                     )
                     
                     if operation_info['success']:
+                        create_backup()
                         st.session_state.dataset = result_df
                         st.success(f"Successfully merged columns into '{new_column_name}'")
                         st.markdown(f"**Rows affected:** {operation_info['rows_affected']}")
@@ -164,7 +200,6 @@ with transformation_tabs[0]:
         st.subheader("Split Column")
         st.markdown("Split a single column into multiple columns based on a separator.")
         
-        available_columns = df.columns.tolist()
         split_column = st.selectbox(
             "Select column to split",
             options=available_columns,
@@ -181,8 +216,7 @@ with transformation_tabs[0]:
                 st.markdown("#### DateTime Components to Extract")
                 datetime_components = st.multiselect(
                     "Select components",
-                    options=['year', 'month', 'day', 'hour', 'minute', 'second', 
-                             'weekday', 'week', 'quarter', 'dayofyear', 'date', 'time'],
+                    options=list(DataTransformer.DATETIME_COMPONENTS),
                     default=['year', 'month', 'day'],
                     help="Choose which datetime components to extract"
                 )
@@ -224,14 +258,11 @@ with transformation_tabs[0]:
                     st.info(f"Estimated number of new columns: {validation['estimated_columns']}")
             
             st.markdown("#### Sample Data")
-            sample_data = df[split_column].dropna().head(5)
-            st.write(sample_data.tolist())
+            st.write(_first_non_null(df[split_column], 5))
             
             col1, col2 = st.columns([1, 1])
             with col1:
                 if st.button("Apply Split", type="primary"):
-                    create_backup()
-                    
                     result_df, operation_info = transformer.split_column(
                         df=df,
                         column=split_column,
@@ -243,6 +274,7 @@ with transformation_tabs[0]:
                     )
                     
                     if operation_info['success']:
+                        create_backup()
                         st.session_state.dataset = result_df
                         st.success(f"Successfully split column into: {operation_info['new_columns']}")
                         st.rerun()
@@ -266,7 +298,8 @@ with transformation_tabs[0]:
                     else:
                         st.error(f"Preview failed: {operation_info['error']}")
 
-with transformation_tabs[1]:
+
+def _expand_json_tab():
     st.header("Expand JSON Data")
     st.markdown("""
     Detect and expand columns containing nested JSON or dictionary-like data.
@@ -278,10 +311,33 @@ with transformation_tabs[1]:
     with expand_tabs[0]:
         st.subheader("Expand JSON/Dictionary Columns")
         
+        exact_json_scan = st.checkbox(
+            "Exact scan",
+            value=False,
+            help="Parse every row instead of a random sample (slower on large datasets)"
+        )
+        
         if st.button("Detect JSON Columns", type="secondary"):
-            with st.spinner("Scanning for JSON/dictionary columns..."):
-                json_columns = transformer.detect_json_columns(df)
-                st.session_state.detected_json_columns = json_columns
+            # Detection is deterministic for a given frame and scan mode, so repeat
+            # clicks reuse the last result until the dataset is replaced
+            cached = st.session_state.get('_transform_json_detection')
+            if cached is None or cached[0]() is not df:
+                cached = (weakref.ref(df), {})
+                st.session_state['_transform_json_detection'] = cached
+            if exact_json_scan not in cached[1]:
+                with st.spinner("Scanning for JSON/dictionary columns..."):
+                    # Auto-optimized uploads hold repetitive text columns as categories
+                    text_df = df.select_dtypes(include=['object', 'string', 'category'])
+                    if exact_json_scan:
+                        json_columns = transformer.detect_json_columns(text_df, sample_rows=None)
+                    else:
+                        sampled_df = text_df.sample(min(len(text_df), 5000), random_state=0)
+                        # Probe every row of the sample so the percentage covers all of it
+                        json_columns = transformer.detect_json_columns(sampled_df, sample_rows=None)
+                    for col_info in json_columns:
+                        col_info['sampled'] = not exact_json_scan
+                    cached[1][exact_json_scan] = json_columns
+            st.session_state.detected_json_columns = cached[1][exact_json_scan]
         
         if 'detected_json_columns' in st.session_state and st.session_state.detected_json_columns:
             json_columns = st.session_state.detected_json_columns
@@ -289,16 +345,16 @@ with transformation_tabs[1]:
             st.success(f"Found {len(json_columns)} column(s) with JSON/dictionary data")
             
             for i, col_info in enumerate(json_columns):
-                with st.expander(f"Column: {col_info['column']} ({col_info['json_percentage']:.1f}% JSON)"):
+                sampled_note = " (sampled)" if col_info.get('sampled') else ""
+                with st.expander(f"Column: {col_info['column']} ({col_info['json_percentage']:.1f}% JSON{sampled_note})"):
                     st.markdown(f"""
                     - **Type:** {'Nested Array' if col_info['is_nested'] else 'Array' if col_info['is_array'] else 'Object'}
                     - **Available Keys:** {', '.join(col_info['keys'][:20])}{'...' if len(col_info['keys']) > 20 else ''}
                     """)
                     
                     st.markdown("##### Sample Data")
-                    sample = df[col_info['column']].dropna().head(3)
-                    for idx, val in enumerate(sample):
-                        st.code(str(val)[:500] + ('...' if len(str(val)) > 500 else ''), language='json')
+                    for val in _first_non_null(df[col_info['column']], 3):
+                        st.code(_sample_text(val), language='json')
             
             st.divider()
             
@@ -342,8 +398,6 @@ with transformation_tabs[1]:
                     col1, col2 = st.columns([1, 1])
                     with col1:
                         if st.button("Apply Expansion", type="primary"):
-                            create_backup()
-                            
                             result_df, operation_info = transformer.expand_json_column(
                                 df=df,
                                 column=selected_json_col,
@@ -353,6 +407,7 @@ with transformation_tabs[1]:
                             )
                             
                             if operation_info['success']:
+                                create_backup()
                                 st.session_state.dataset = result_df
                                 st.success(f"Successfully expanded JSON column")
                                 st.markdown(f"**New columns:** {operation_info['new_columns']}")
@@ -386,7 +441,6 @@ with transformation_tabs[1]:
         st.subheader("Convert Columns to JSON/Dictionary")
         st.markdown("Combine multiple columns back into a JSON/dictionary format.")
         
-        available_columns = df.columns.tolist()
         columns_to_combine = st.multiselect(
             "Select columns to combine into JSON",
             options=available_columns,
@@ -414,15 +468,11 @@ with transformation_tabs[1]:
             group_by = None if group_by_col == 'None' else group_by_col
             
             st.markdown("##### Preview")
-            preview_data = df[columns_to_combine].head(3).to_dict('records')
-            for record in preview_data:
-                st.json(record)
+            st.json(df.iloc[:3][columns_to_combine].to_dict('records'))
             
             col1, col2 = st.columns([1, 1])
             with col1:
                 if st.button("Convert to JSON", type="primary"):
-                    create_backup()
-                    
                     result_df, operation_info = transformer.columns_to_json(
                         df=df,
                         columns=columns_to_combine,
@@ -432,6 +482,7 @@ with transformation_tabs[1]:
                     )
                     
                     if operation_info['success']:
+                        create_backup()
                         st.session_state.dataset = result_df
                         st.success(f"Successfully created JSON column '{new_json_column}'")
                         st.rerun()
@@ -452,31 +503,68 @@ with transformation_tabs[1]:
                     else:
                         st.error(f"Preview failed: {operation_info['error']}")
 
+
+with transformation_tabs[0]:
+    _as_fragment(_merge_split_tab)()
+
+with transformation_tabs[1]:
+    _as_fragment(_expand_json_tab)()
+
 st.divider()
 st.subheader("Current Dataset Status")
 
+# One non-null count per column, shared by the metrics and the dtype table
+non_null_counts = df.count()
+
 col1, col2, col3, col4 = st.columns(4)
 with col1:
     st.metric("Total Rows", f"{len(df):,}")
 with col2:
     st.metric("Total Columns", len(df.columns))
 with col3:
-    st.metric("Missing Values", f"{df.isnull().sum().sum():,}")
+    st.metric("Missing Values", f"{len(df) * len(df.columns) - int(non_null_counts.sum()):,}")
 with col4:
-    st.metric("Memory Usage", f"{df.memory_usage(deep=True).sum() / 1024**2:.1f} MB")
+    # A deep count walks every Python object, so it only runs on request and is
+    # kept for the current frame
+    deep_memory = st.session_state.get('_transform_deep_memory')
+    if deep_memory is not None and deep_memory[0]() is df:
+        st.metric("Memory Usage", f"{deep_memory[1] / 1024**2:.1f} MB")
+    else:
+        st.metric(
+            "Memory Usage",
+            f"{df.memory_usage(deep=False).sum() / 1024**2:.1f} MB",
+            help="Shallow estimate; object columns only count their pointers"
+        )
+        if st.button("Compute exact memory"):
+            st.session_state['_transform_deep_memory'] = (
+                weakref.ref(df), int(df.memory_usage(deep=True).sum())
+            )
+            st.rerun()
 
 if st.checkbox("Show current dataset preview"):
     st.dataframe(df.head(20), use_container_width=True)
 
 if st.checkbox("Show column data types"):
-    dtype_info = []
-    for col in df.columns:
-        detected = transformer.detect_column_dtype(df[col])
-        dtype_info.append({
-            'Column': col,
-            'Pandas dtype': str(df[col].dtype),
-            'Detected type': detected,
-            'Non-null count': df[col].notna().sum(),
-            'Null count': df[col].isna().sum()
-        })
-    st.dataframe(pd.DataFrame(dtype_info), use_container_width=True)
+    # The table only changes when the dataset object is replaced, so build it once
+    # per frame and reuse it across reruns
+    cached = st.session_state.get('_transform_dtype_table')
+    if cached is None or cached[0]() is not df:
+        dtype_info = []
+        for i, col in enumerate(df.columns):
+            series = df.iloc[:, i]
+            non_null = int(non_null_counts.iat[i])
+            dtype_info.append({
+                'Column': col,
+                'Pandas dtype': str(series.dtype),
+                'Detected type': transformer.detect_column_dtype(series),
+                'Non-null count': non_null,
+                'Null count': len(df) - non_null
+            })
+        dtype_table = pd.DataFrame(dtype_info)
+        # Only a handful of distinct dtype names repeat down these columns
+        dtype_table[['Pandas dtype', 'Detected type']] = (
+            dtype_table[['Pandas dtype', 'Detected type']].astype('category')
+        )
+        cached = (weakref.ref(df), dtype_table)
+        st.session_state['_transform_dtype_table'] = cached
+    st.dataframe(cached[1], use_container_width=True)
@@ -4,7 +4,6 @@ import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from modules.utils import initialize_session_state, get_column_summary, format_number
-from modules.data_analyzer import ColumnAnalyzer
 from modules.visualization import DataVisualizer
 from modules.ai_assistant import AIAssistant
 
@@ -51,7 +50,7 @@ if st.session_state.get('inter_column_violations', {}).get('total_violations', 0
             for rule in violations['rule_checks']:
                 st.write(f"**{rule['rule_type'].replace('_', ' ').title()}:** {rule['description']} ({rule['violations']} violations)")
                 st.caption(f"Columns involved: {', '.join(rule['columns'])}")
-analyzer = ColumnAnalyzer()
+analyzer = st.session_state.data_analyzer
 visualizer = DataVisualizer()
 
 st.markdown("""
@@ -702,21 +701,22 @@ with st.sidebar:
     st.write(f"{analyzed_count}/{total_count} columns analyzed")
     
     if st.button("🔍 Analyze All Columns", width='stretch'):
-        analyzer = ColumnAnalyzer()
-        
         progress_bar = st.progress(0)
         status_text = st.empty()
+        # Batch front-end updates to ~50 redraws regardless of column count
+        step = max(1, total_count // 50)
         
-        for i, col in enumerate(df.columns):
+        for i, col in enumerate(df.columns, start=1):
             if col not in st.session_state.column_analysis:
-                status_text.text(f"Analyzing: {col}")
                 try:
                     analysis = analyzer.analyze_column(df, col)
                     st.session_state.column_analysis[col] = analysis
                 except Exception as e:
                     st.error(f"Error analyzing {col}: {str(e)}")
                 
-            progress_bar.progress((i + 1) / len(df.columns))
+            if i % step == 0 or i == total_count:
+                status_text.text(f"Analyzing: {col}")
+                progress_bar.progress(i / total_count)
         
         status_text.text("✅ All columns analyzed!")
         st.success("Analysis complete!")
@@ -22,7 +22,7 @@ if st.session_state.dataset is None:
     st.warning("⚠️ No dataset loaded. Please upload a dataset on the Home page first.")
     st.stop()
 
-df = st.session_state.dataset.copy()
+df = st.session_state.dataset.copy(deep=False)  # copy-on-write: columns copy when changed
 cleaning_engine = DataCleaningEngine()
 visualizer = DataVisualizer()
 analyzer = st.session_state.data_analyzer
@@ -229,7 +229,10 @@ with preview_cols[1]:
                 
                 # Apply changes
                 preview = st.session_state.preview_results
-                st.session_state.dataset[selected_column] = preview['cleaned']
+                # Rebind rather than mutate so the home page overview cache sees a new frame
+                new_dataset = st.session_state.dataset.copy(deep=False)
+                new_dataset[selected_column] = preview['cleaned']
+                st.session_state.dataset = new_dataset
                 
                 # Save operation to history
                 operation = {
@@ -305,6 +308,10 @@ if 'preview_results' in st.session_state:
     # Show rows that changed
     original_series = preview['original']
     cleaned_series = preview['cleaned']
+    # Categoricals only compare when their categories match
+    if isinstance(original_series.dtype, pd.CategoricalDtype) or isinstance(cleaned_series.dtype, pd.CategoricalDtype):
+        original_series = original_series.astype(object)
+        cleaned_series = cleaned_series.astype(object)
     
     changed_mask = (original_series != cleaned_series) | (original_series.isnull() != cleaned_series.isnull())
     changed_indices = changed_mask[changed_mask].index[:20]  # Show first 20 changes